@@ -13,6 +13,7 @@ REQUEST_SLEEP = 0.5  # polite delay between HTTP requests
 INGREDIENT_FETCH_ATTEMPTS = 6
 INGREDIENT_PLACEHOLDER_MARKER = "__INCISCRAPER_PLACEHOLDER__"
 PROGRESS_LOG_INTERVAL = 10
+DETAIL_PREFETCH_WINDOW = 4  # product pages downloaded ahead of parsing
 
 
 EXPECTED_SCHEMA: Dict[str, Set[str]] = {
@@ -38,6 +39,8 @@ EXPECTED_SCHEMA: Dict[str, Set[str]] = {
         "discontinued",
         "replacement_product_url",
         "details_scraped",
+        "etag",
+        "last_modified",
         "last_checked_at",
         "last_updated_at",
     },
@@ -77,6 +80,8 @@ ADDITIONAL_COLUMN_DEFINITIONS: Dict[str, Dict[str, str]] = {
         "key_ingredient_ids_json": "key_ingredient_ids_json TEXT",
         "other_ingredient_ids_json": "other_ingredient_ids_json TEXT",
         "free_tag_ids_json": "free_tag_ids_json TEXT",
+        "etag": "etag TEXT",
+        "last_modified": "last_modified TEXT",
         "last_checked_at": "last_checked_at TEXT",
         "last_updated_at": "last_updated_at TEXT",
     },
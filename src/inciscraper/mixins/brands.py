@@ -6,7 +6,7 @@ import json
 import logging
 import sqlite3
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 from ..constants import PROGRESS_LOG_INTERVAL
 from ..parser import extract_text, parse_html
@@ -35,6 +35,8 @@ class BrandScraperMixin:
         """
         import random
         
+        brands_url = f"{self.base_url}/brands"
+        
         def save_state(stage: str, lower: int, upper: int, next_page: int, checks: int) -> None:
             state = {
                 "stage": stage,
@@ -99,7 +101,7 @@ class BrandScraperMixin:
                     self._set_metadata("brands_discovering_pages", "0")
                     return lower_bound
                 
-                url = self._append_offset(self.base_url + "/brands", page_num)
+                url = self._append_offset(brands_url, page_num)
                 
                 # Update progress metadata for UI
                 self._set_metadata("progress_brands_current_page", str(page_num))
@@ -165,7 +167,7 @@ class BrandScraperMixin:
                 mid = upper_bound - 1
             mid = max(mid, 1)
             
-            url = self._append_offset(self.base_url + "/brands", mid)
+            url = self._append_offset(brands_url, mid)
             
             self._set_metadata("progress_brands_current_page", str(mid))
             LOGGER.info("Checking brand discovery page %s", mid)
@@ -212,8 +214,9 @@ class BrandScraperMixin:
         """Collect brand listings and persist them to the database."""
 
         if reset_offset:
-            self._set_metadata("brands_next_offset", "1")
-            self._set_metadata("brands_total_offsets", "0")
+            self._set_metadata_many(
+                (("brands_next_offset", "1"), ("brands_total_offsets", "0"))
+            )
             
         start_offset = int(self._get_metadata("brands_next_offset", "1"))
         if start_offset > 1:
@@ -249,6 +252,7 @@ class BrandScraperMixin:
             planned_pages,
             total_offsets_known,
         )
+        brands_url = f"{self.base_url}/brands"
         offset = start_offset
         processed_pages = 0
         final_total = total_offsets_known
@@ -263,7 +267,7 @@ class BrandScraperMixin:
             if max_pages is not None and processed_pages >= max_pages:
                 break
             
-            current_url = self._append_offset(self.base_url + "/brands", offset)
+            current_url = self._append_offset(brands_url, offset)
             
             # Log current brand page being scraped
             LOGGER.info("Currently scraping brand page %s/%s", offset, total_offsets_known)
@@ -277,23 +281,28 @@ class BrandScraperMixin:
                 LOGGER.debug("No more brands found on %s", current_url)
                 break
             limit_reached = False
-            for name, url in brands:
-                inserted = self._insert_brand(name, url)
-                if (
-                    max_brands is not None
-                    and inserted
-                    and (self.conn.execute("SELECT COUNT(*) FROM brands").fetchone()[0])
-                    >= max_brands
-                ):
+            if max_brands is None:
+                self._insert_brands_bulk(brands)
+            else:
+                brands, new_count = self._take_until_new_limit(
+                    "brands", brands, max_brands - existing_brand_total
+                )
+                self._insert_brands_bulk(brands)
+                existing_brand_total += new_count
+                if existing_brand_total >= max_brands:
                     LOGGER.info("Reached brand limit (%s) – stopping", max_brands)
                     final_total = max(final_total, offset)
                     limit_reached = True
-                    break
             processed_pages += 1
             
-            # Update progress metadata AFTER page is successfully processed
-            self._set_metadata("progress_brands_current_page", str(offset))
-            self._set_metadata("progress_brands_total_pages", str(total_offsets_known))
+            # Update progress metadata AFTER page is successfully processed;
+            # this commit also covers the page's bulk brand upsert.
+            self._set_metadata_many(
+                (
+                    ("progress_brands_current_page", str(offset)),
+                    ("progress_brands_total_pages", str(total_offsets_known)),
+                )
+            )
             if processed_pages % PROGRESS_LOG_INTERVAL == 0:
                 self._log_progress("Brand page", processed_pages, planned_pages)
             if limit_reached:
@@ -301,11 +310,12 @@ class BrandScraperMixin:
             offset += 1
             final_total = max(final_total, offset - 1)
             self._adaptive_sleep()
-        self._set_metadata("brands_next_offset", str(offset))
-        if final_total:
-            self._set_metadata("brands_total_offsets", str(final_total))
-        else:
-            self._set_metadata("brands_total_offsets", "0")
+        self._set_metadata_many(
+            (
+                ("brands_next_offset", str(offset)),
+                ("brands_total_offsets", str(final_total) if final_total else "0"),
+            )
+        )
         
         if processed_pages:
             total_for_log = planned_pages if planned_pages else 0
@@ -329,13 +339,16 @@ class BrandScraperMixin:
     def _parse_brand_list(self, html: str) -> List[Tuple[str, str]]:
         """Extract brand names and URLs from a listing page."""
 
-        root = parse_html(html)
+        # One walk feeds both the list-item markup and its fallback.
+        all_nodes = parse_html(html).find_all()
         brands: List[Tuple[str, str]] = []
-        nodes = root.find_all(class_="brandlist__item")
+        nodes = [node for node in all_nodes if node.has_class("brandlist__item")]
         if not nodes:
             # Fallback for the updated brand list markup that uses direct anchor
             # elements with the ``simpletextlistitem`` class.
-            for anchor in root.find_all(tag="a", class_="simpletextlistitem"):
+            for anchor in all_nodes:
+                if anchor.tag != "a" or not anchor.has_class("simpletextlistitem"):
+                    continue
                 href = anchor.get("href")
                 name = extract_text(anchor)
                 if not href or not name:
@@ -354,44 +367,30 @@ class BrandScraperMixin:
             brands.append((name, self._absolute_url(href)))
         return brands
 
-    def _insert_brand(self, name: str, url: str) -> bool:
-        """Insert or update a brand record."""
+    def _insert_brands_bulk(self, brands: List[Tuple[str, str]]) -> None:
+        """Insert or update a page of brands with one statement.
+
+        New brands are inserted and existing ones refresh ``last_checked_at`` and, when the name changed or
+        was never stamped, ``last_updated_at``.
+        """
 
+        if not brands:
+            return
         now = self._current_timestamp()
-        row = self.conn.execute(
-            "SELECT id, name, last_updated_at FROM brands WHERE url = ?",
-            (url,),
-        ).fetchone()
-        if row is None:
-            while True:
-                brand_id = self._generate_id()
-                try:
-                    self.conn.execute(
-                        """
-                        INSERT INTO brands (id, name, url, products_scraped, last_checked_at, last_updated_at)
-                        VALUES (?, ?, ?, 0, ?, ?)
-                        """,
-                        (brand_id, name, url, now, now),
-                    )
-                except sqlite3.IntegrityError as exc:
-                    if "brands.id" in str(exc):
-                        continue
-                    raise
-                self.conn.commit()
-                return True
-        updates: Dict[str, str] = {"last_checked_at": now}
-        changed = False
-        if row["name"] != name:
-            updates["name"] = name
-            changed = True
-        if changed or not row["last_updated_at"]:
-            updates["last_updated_at"] = now
-        if updates:
-            assignments = ", ".join(f"{column} = ?" for column in updates)
-            params = list(updates.values()) + [row["id"]]
-            self.conn.execute(
-                f"UPDATE brands SET {assignments} WHERE id = ?",
-                params,
-            )
-            self.conn.commit()
-        return False
+        self.conn.executemany(
+            """
+            INSERT INTO brands (name, url, products_scraped, last_checked_at, last_updated_at)
+            VALUES (?, ?, 0, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                name = excluded.name,
+                last_checked_at = excluded.last_checked_at,
+                last_updated_at = CASE
+                    WHEN brands.name != excluded.name
+                         OR brands.last_updated_at IS NULL
+                         OR brands.last_updated_at = ''
+                    THEN excluded.last_updated_at
+                    ELSE brands.last_updated_at
+                END
+            """,
+            [(name, url, now, now) for name, url in brands],
+        )
@@ -2,14 +2,115 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import sqlite3
-from typing import Dict, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from ..constants import ADDITIONAL_COLUMN_DEFINITIONS, EXPECTED_SCHEMA
 
 LOGGER = logging.getLogger(__name__)
 
+_METADATA_UPSERT_SQL = """
+    INSERT INTO metadata (key, value) VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+# ``CREATE TABLE`` statements for every table, in dependency order.
+_TABLE_DEFINITIONS: Dict[str, str] = {
+    "brands": """
+    CREATE TABLE IF NOT EXISTS brands (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        url TEXT NOT NULL UNIQUE,
+        products_scraped INTEGER NOT NULL DEFAULT 0,
+        last_checked_at TEXT,
+        last_updated_at TEXT
+    )
+""",
+    "products": """
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY,
+        brand_id INTEGER NOT NULL REFERENCES brands(id),
+        name TEXT NOT NULL,
+        url TEXT NOT NULL UNIQUE,
+        description TEXT,
+        image_path TEXT,
+        ingredient_ids_json TEXT,
+        key_ingredient_ids_json TEXT,
+        other_ingredient_ids_json TEXT,
+        free_tag_ids_json TEXT,
+        discontinued INTEGER NOT NULL DEFAULT 0,
+        replacement_product_url TEXT,
+        details_scraped INTEGER NOT NULL DEFAULT 0,
+        etag TEXT,
+        last_modified TEXT,
+        last_checked_at TEXT,
+        last_updated_at TEXT
+    )
+""",
+    "ingredients": """
+    CREATE TABLE IF NOT EXISTS ingredients (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        url TEXT NOT NULL UNIQUE,
+        rating_tag TEXT,
+        also_called TEXT,
+        cosing_function_ids_json TEXT,
+        irritancy TEXT,
+        comedogenicity TEXT,
+        details_text LONGTEXT,
+        cosing_cas_numbers_json TEXT,
+        cosing_ec_numbers_json TEXT,
+        cosing_identified_ingredients_json TEXT,
+        cosing_regulation_provisions_json TEXT,
+        quick_facts_json TEXT,
+        proof_references_json TEXT,
+        last_checked_at TEXT,
+        last_updated_at TEXT
+    )
+""",
+    "functions": """
+    CREATE TABLE IF NOT EXISTS functions (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL
+    )
+""",
+    "metadata": """
+    CREATE TABLE IF NOT EXISTS metadata (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+""",
+}
+_INTEGER_KEY_TABLES = ("brands", "products", "ingredients", "functions")
+# Indexes for the pending-work scans and per-brand product lookups. The integer
+# primary key is the rowid, which every index entry already carries, so they
+# also satisfy ``ORDER BY id``.
+_INDEX_DEFINITIONS = (
+    "CREATE INDEX IF NOT EXISTS idx_brands_pending ON brands(products_scraped)",
+    "CREATE INDEX IF NOT EXISTS idx_products_pending ON products(details_scraped)",
+    "CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand_id)",
+)
+
+# ``brand_id`` given to legacy products whose brand row no longer exists.
+# Rowids start at 1, so no brand ever matches it; foreign keys are not
+# enforced, and the next listing pass that finds the product re-assigns it.
+_ORPHAN_BRAND_ID = 0
+
+# Per-brand product progress keys, suffixed with the brand id.
+_BRAND_PROGRESS_PREFIXES = ("brand_products_next_offset:", "brand_empty_products:")
+
+
+def _prefix_bounds(prefix: str) -> Tuple[str, str]:
+    """Return the ``[low, high)`` key range covering every key starting with ``prefix``.
+
+    ``LIKE`` is case-insensitive and treats ``_`` as a wildcard, so SQLite
+    cannot seek the ``metadata`` primary key for it; a plain range can.
+    """
+
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 
 class DatabaseMixin:
     """Utility mixin exposing schema and metadata helpers."""
@@ -26,74 +127,23 @@ class DatabaseMixin:
         # Enable WAL mode for better concurrent performance
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
-        cursor.execute("PRAGMA cache_size=10000")  # 10MB cache
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
         cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.execute("PRAGMA mmap_size=268435456")  # 256MB memory mapping
         
         self._enforce_schema()
         cursor.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS brands (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                url TEXT NOT NULL UNIQUE,
-                products_scraped INTEGER NOT NULL DEFAULT 0,
-                last_checked_at TEXT,
-                last_updated_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS products (
-                id TEXT PRIMARY KEY,
-                brand_id TEXT NOT NULL REFERENCES brands(id),
-                name TEXT NOT NULL,
-                url TEXT NOT NULL UNIQUE,
-                description TEXT,
-                image_path TEXT,
-                ingredient_ids_json TEXT,
-                key_ingredient_ids_json TEXT,
-                other_ingredient_ids_json TEXT,
-                free_tag_ids_json TEXT,
-                discontinued INTEGER NOT NULL DEFAULT 0,
-                replacement_product_url TEXT,
-                details_scraped INTEGER NOT NULL DEFAULT 0,
-                last_checked_at TEXT,
-                last_updated_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS ingredients (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                url TEXT NOT NULL UNIQUE,
-                rating_tag TEXT,
-                also_called TEXT,
-                cosing_function_ids_json TEXT,
-                irritancy TEXT,
-                comedogenicity TEXT,
-                details_text LONGTEXT,
-                cosing_cas_numbers_json TEXT,
-                cosing_ec_numbers_json TEXT,
-                cosing_identified_ingredients_json TEXT,
-                cosing_regulation_provisions_json TEXT,
-                quick_facts_json TEXT,
-                proof_references_json TEXT,
-                last_checked_at TEXT,
-                last_updated_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS functions (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            );
-            """
+            ";\n".join(_TABLE_DEFINITIONS.values()) + ";"
         )
         self.conn.commit()
+        # Legacy text ids must be converted before the rebuild helpers below
+        # copy rows into tables keyed by integers.
+        self._ensure_integer_primary_keys()
         self._ensure_ingredient_details_capacity()
         self._ensure_functions_minimal_schema()
+        for statement in _INDEX_DEFINITIONS:
+            self.conn.execute(statement)
+        self.conn.commit()
 
     # ------------------------------------------------------------------
     # Metadata helpers
@@ -109,30 +159,84 @@ class DatabaseMixin:
             return default
         return row["value"]
 
-    def _set_metadata(self, key: str, value: str) -> None:
-        """Persist a metadata value."""
+    def _set_metadata(self, key: str, value: str, *, commit: bool = True) -> None:
+        """Persist a metadata value.
 
-        self.conn.execute(
-            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
-            (key, value),
-        )
-        self.conn.commit()
+        Pass ``commit=False`` to fold the write into the caller's transaction.
+        """
+
+        self.conn.execute(_METADATA_UPSERT_SQL, (key, value))
+        if commit:
+            self.conn.commit()
+
+    def _set_metadata_many(
+        self, items: Iterable[Tuple[str, str]], *, commit: bool = True
+    ) -> None:
+        """Persist several metadata values with a single statement.
 
-    def _delete_metadata(self, key: str) -> None:
-        """Remove ``key`` from the metadata table if it exists."""
+        Pass ``commit=False`` to fold the writes into the caller's transaction.
+        """
+
+        self.conn.executemany(_METADATA_UPSERT_SQL, items)
+        if commit:
+            self.conn.commit()
+
+    def _delete_metadata(self, key: str, *, commit: bool = True) -> None:
+        """Remove ``key`` from the metadata table if it exists.
+
+        Pass ``commit=False`` to fold the write into the caller's transaction.
+        """
 
         self.conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
-        self.conn.commit()
+        if commit:
+            self.conn.commit()
+
+    def _take_until_new_limit(
+        self, table: str, rows: List[Tuple[str, str]], remaining: int
+    ) -> Tuple[List[Tuple[str, str]], int]:
+        """Trim a page of ``(name, url)`` rows once ``remaining`` are new.
+
+        One ``url IN (...)`` lookup classifies the page, so a limited scrape
+        can still hand the kept rows to a single bulk upsert.  Returns the
+        kept rows and how many of them are not yet stored in ``table``.
+        """
+
+        urls = {url for _, url in rows}
+        placeholders = ", ".join("?" for _ in urls)
+        known = {
+            row[0]
+            for row in self.conn.execute(
+                f"SELECT url FROM {table} WHERE url IN ({placeholders})",
+                tuple(urls),
+            )
+        }
+        new = 0
+        for index, (_, url) in enumerate(rows):
+            if url in known:
+                continue
+            known.add(url)
+            new += 1
+            if new >= remaining:
+                return rows[: index + 1], new
+        return rows, new
 
     def _count_metadata_with_prefix(self, prefix: str) -> int:
         """Count how many metadata keys share ``prefix``."""
 
         row = self.conn.execute(
-            "SELECT COUNT(*) FROM metadata WHERE key LIKE ?",
-            (f"{prefix}%",),
+            "SELECT COUNT(*) FROM metadata WHERE key >= ? AND key < ?",
+            _prefix_bounds(prefix),
         ).fetchone()
         return int(row[0]) if row else 0
 
+    def _delete_metadata_with_prefix(self, prefix: str) -> None:
+        """Remove every metadata key starting with ``prefix`` (no commit)."""
+
+        self.conn.execute(
+            "DELETE FROM metadata WHERE key >= ? AND key < ?",
+            _prefix_bounds(prefix),
+        )
+
     def _metadata_has_incomplete_brands(self) -> bool:
         """Return ``True`` when brand scraping metadata signals pending work."""
 
@@ -146,25 +250,21 @@ class DatabaseMixin:
     def _reset_brand_completion_flags_if_products_empty(self) -> None:
         """Reset brand completion flags when the products table has been cleared."""
 
-        completed_brands = self.conn.execute(
-            "SELECT COUNT(*) FROM brands WHERE products_scraped = 1",
-        ).fetchone()[0]
-        if completed_brands == 0:
+        if not self.conn.execute(
+            "SELECT 1 FROM brands WHERE products_scraped = 1 LIMIT 1",
+        ).fetchone():
             return
-        total_products = self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
-        if total_products > 0:
+        if self.conn.execute("SELECT 1 FROM products LIMIT 1").fetchone():
             return
+        completed_brands = self.conn.execute(
+            "UPDATE brands SET products_scraped = 0 WHERE products_scraped = 1",
+        ).rowcount
         LOGGER.info(
             "Products table is empty but %s brand(s) marked complete – resetting state",
             completed_brands,
         )
-        self.conn.execute("UPDATE brands SET products_scraped = 0")
-        self.conn.execute(
-            "DELETE FROM metadata WHERE key LIKE 'brand_products_next_offset:%'",
-        )
-        self.conn.execute(
-            "DELETE FROM metadata WHERE key LIKE 'brand_empty_products:%'",
-        )
+        for prefix in _BRAND_PROGRESS_PREFIXES:
+            self._delete_metadata_with_prefix(prefix)
         self.conn.commit()
 
     def _ensure_ingredient_details_capacity(self) -> None:
@@ -186,30 +286,6 @@ class DatabaseMixin:
             "Rebuilding ingredients table to expand details_text capacity (previous type: %s)",
             column_type,
         )
-        self.conn.execute("ALTER TABLE ingredients RENAME TO ingredients_backup")
-        self.conn.executescript(
-            """
-            CREATE TABLE ingredients (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                url TEXT NOT NULL UNIQUE,
-                rating_tag TEXT,
-                also_called TEXT,
-                cosing_function_ids_json TEXT,
-                irritancy TEXT,
-                comedogenicity TEXT,
-                details_text LONGTEXT,
-                cosing_cas_numbers_json TEXT,
-                cosing_ec_numbers_json TEXT,
-                cosing_identified_ingredients_json TEXT,
-                cosing_regulation_provisions_json TEXT,
-                quick_facts_json TEXT,
-                proof_references_json TEXT,
-                last_checked_at TEXT,
-                last_updated_at TEXT
-            );
-            """
-        )
         columns = (
             "id, name, url, rating_tag, also_called, cosing_function_ids_json, irritancy, "
             "comedogenicity, details_text, cosing_cas_numbers_json, cosing_ec_numbers_json, "
@@ -217,10 +293,17 @@ class DatabaseMixin:
             "quick_facts_json, proof_references_json, "
             "last_checked_at, last_updated_at"
         )
-        self.conn.execute(
-            f"INSERT INTO ingredients ({columns}) SELECT {columns} FROM ingredients_backup",
-        )
-        self.conn.execute("DROP TABLE ingredients_backup")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("ALTER TABLE ingredients RENAME TO ingredients_backup")
+            self.conn.execute(_TABLE_DEFINITIONS["ingredients"])
+            self.conn.execute(
+                f"INSERT INTO ingredients ({columns}) SELECT {columns} FROM ingredients_backup",
+            )
+            self.conn.execute("DROP TABLE ingredients_backup")
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
         self.conn.commit()
 
     def _ensure_functions_minimal_schema(self) -> None:
@@ -234,88 +317,234 @@ class DatabaseMixin:
         if set(column_names) == {"id", "name"} and len(column_names) == 2:
             return
         LOGGER.info("Rebuilding functions table to drop legacy columns")
-        self.conn.execute("ALTER TABLE functions RENAME TO functions_backup")
-        self.conn.executescript(
-            """
-            CREATE TABLE functions (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL
-            );
-            INSERT OR IGNORE INTO functions (id, name)
-            SELECT id, name FROM functions_backup;
-            DROP TABLE functions_backup;
-            """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("ALTER TABLE functions RENAME TO functions_backup")
+            self.conn.execute(_TABLE_DEFINITIONS["functions"])
+            self.conn.execute(
+                "INSERT OR IGNORE INTO functions (id, name) "
+                "SELECT id, name FROM functions_backup"
+            )
+            self.conn.execute("DROP TABLE functions_backup")
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _ensure_integer_primary_keys(self) -> None:
+        """Convert tables keyed by legacy random hex ids to integer keys.
+
+        Every legacy row keeps its implicit ``rowid`` as its new ``id``, so
+        ``brand_id``, the ``*_ids_json`` columns and per-brand metadata keys are
+        remapped through the old tables before they are dropped. The whole
+        conversion runs in a single transaction.
+        """
+
+        legacy_tables = []
+        for table in _INTEGER_KEY_TABLES:
+            for row in self.conn.execute(f"PRAGMA table_info({table})"):
+                if row["name"] == "id" and (row["type"] or "").upper() != "INTEGER":
+                    legacy_tables.append(table)
+        if not legacy_tables:
+            return
+        LOGGER.info(
+            "Converting text identifiers to integer primary keys (%s)",
+            ", ".join(legacy_tables),
         )
         self.conn.commit()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in reversed(_INTEGER_KEY_TABLES):
+                self.conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+            for table in _INTEGER_KEY_TABLES:
+                self.conn.execute(_TABLE_DEFINITIONS[table])
+                new_columns = [
+                    row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")
+                ]
+                old_columns = {
+                    row["name"]
+                    for row in self.conn.execute(f"PRAGMA table_info({table}_legacy)")
+                }
+                copied = [
+                    column
+                    for column in new_columns
+                    if column in old_columns and column not in {"id", "brand_id"}
+                ]
+                select_columns = ", ".join(f"t.{column}" for column in copied)
+                if table == "products":
+                    orphans = self.conn.execute(
+                        """
+                        SELECT COUNT(*) FROM products_legacy AS t
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM brands_legacy AS b WHERE b.id = t.brand_id
+                        )
+                        """
+                    ).fetchone()[0]
+                    if orphans:
+                        LOGGER.warning(
+                            "%s product(s) reference a missing brand – keeping them "
+                            "with brand_id %s",
+                            orphans,
+                            _ORPHAN_BRAND_ID,
+                        )
+                    self.conn.execute(
+                        f"""
+                        INSERT INTO products (id, brand_id, {", ".join(copied)})
+                        SELECT t.rowid, COALESCE(b.rowid, ?), {select_columns}
+                        FROM products_legacy AS t
+                        LEFT JOIN brands_legacy AS b ON b.id = t.brand_id
+                        """,
+                        (_ORPHAN_BRAND_ID,),
+                    )
+                else:
+                    self.conn.execute(
+                        f"""
+                        INSERT INTO {table} (id, {", ".join(copied)})
+                        SELECT t.rowid, {select_columns} FROM {table}_legacy AS t
+                        """
+                    )
+            self._remap_id_lists(
+                "products",
+                (
+                    "ingredient_ids_json",
+                    "key_ingredient_ids_json",
+                    "other_ingredient_ids_json",
+                ),
+                self._legacy_id_map("ingredients"),
+            )
+            self._remap_id_lists(
+                "ingredients",
+                ("cosing_function_ids_json",),
+                self._legacy_id_map("functions"),
+            )
+            brand_ids = self._legacy_id_map("brands")
+            for prefix in _BRAND_PROGRESS_PREFIXES:
+                rows = self.conn.execute(
+                    "SELECT key, value FROM metadata WHERE key >= ? AND key < ?",
+                    _prefix_bounds(prefix),
+                ).fetchall()
+                for row in rows:
+                    self.conn.execute("DELETE FROM metadata WHERE key = ?", (row["key"],))
+                    new_id = brand_ids.get(row["key"][len(prefix):])
+                    if new_id is not None:
+                        self.conn.execute(
+                            _METADATA_UPSERT_SQL, (f"{prefix}{new_id}", row["value"])
+                        )
+            for table in reversed(_INTEGER_KEY_TABLES):
+                self.conn.execute(f"DROP TABLE {table}_legacy")
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _legacy_id_map(self, table: str) -> Dict[str, int]:
+        """Map the old identifiers of ``table`` to the rowids used as new ids."""
+
+        return {
+            str(row[0]): row[1]
+            for row in self.conn.execute(f"SELECT id, rowid FROM {table}_legacy")
+        }
+
+    def _remap_id_lists(
+        self, table: str, columns: Iterable[str], id_map: Dict[str, int]
+    ) -> None:
+        """Rewrite JSON id lists in ``columns`` of ``table`` through ``id_map``."""
+
+        for column in columns:
+            updates = []
+            for row in self.conn.execute(
+                f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL"
+            ):
+                try:
+                    values = json.loads(row[1])
+                except ValueError:
+                    continue
+                if not isinstance(values, list):
+                    continue
+                remapped = [id_map[str(value)] for value in values if str(value) in id_map]
+                updates.append((json.dumps(remapped, separators=(",", ":")), row[0]))
+            self.conn.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE id = ?", updates
+            )
 
     def _enforce_schema(self) -> None:
         """Ensure only expected tables and columns exist in the database."""
 
-        cursor = self.conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        existing_tables = {row["name"] for row in cursor.fetchall()}
-        dropped_tables: Set[str] = set()
-        for table in existing_tables:
-            if table.startswith("sqlite_"):
-                continue
-            if table not in EXPECTED_SCHEMA:
-                LOGGER.info("Dropping unexpected table: %s", table)
-                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
-                dropped_tables.add(table)
-        for table, expected_columns in EXPECTED_SCHEMA.items():
-            cursor = self.conn.execute(f"PRAGMA table_info({table})")
-            rows = cursor.fetchall()
-            if not rows:
-                continue
-            actual_columns = {row["name"] for row in rows}
-            missing_columns = expected_columns - actual_columns
-            recreate_table = False
-            if missing_columns:
-                definitions = ADDITIONAL_COLUMN_DEFINITIONS.get(table, {})
-                for column in sorted(missing_columns):
-                    definition = definitions.get(column)
-                    if not definition:
-                        recreate_table = True
-                        break
-                    LOGGER.info("Adding missing column %s.%s", table, column)
-                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
-                if recreate_table:
-                    LOGGER.info(
-                        "Recreating table %s due to missing columns without definitions (%s)",
-                        table,
-                        sorted(missing_columns),
-                    )
+        # Schema fixes and the matching progress resets share one transaction,
+        # so an interrupted run never leaves half-rebuilt tables behind.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            existing_tables = {row["name"] for row in cursor.fetchall()}
+            dropped_tables: Set[str] = set()
+            for table in existing_tables:
+                if table.startswith("sqlite_"):
+                    continue
+                if table not in EXPECTED_SCHEMA:
+                    LOGGER.info("Dropping unexpected table: %s", table)
                     self.conn.execute(f"DROP TABLE IF EXISTS {table}")
                     dropped_tables.add(table)
+            for table, expected_columns in EXPECTED_SCHEMA.items():
+                cursor = self.conn.execute(f"PRAGMA table_info({table})")
+                rows = cursor.fetchall()
+                if not rows:
                     continue
-                actual_columns.update(missing_columns)
-            extra_columns = actual_columns - expected_columns
-            if extra_columns:
-                if table == "functions":
+                actual_columns = {row["name"] for row in rows}
+                missing_columns = expected_columns - actual_columns
+                recreate_table = False
+                if missing_columns:
+                    definitions = ADDITIONAL_COLUMN_DEFINITIONS.get(table, {})
+                    for column in sorted(missing_columns):
+                        definition = definitions.get(column)
+                        if not definition:
+                            recreate_table = True
+                            break
+                        LOGGER.info("Adding missing column %s.%s", table, column)
+                        self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
+                    if recreate_table:
+                        LOGGER.info(
+                            "Recreating table %s due to missing columns without definitions (%s)",
+                            table,
+                            sorted(missing_columns),
+                        )
+                        self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                        dropped_tables.add(table)
+                        continue
+                    actual_columns.update(missing_columns)
+                extra_columns = actual_columns - expected_columns
+                if extra_columns:
+                    if table == "functions":
+                        LOGGER.info(
+                            "Deferring functions table rebuild to drop legacy columns (found: %s)",
+                            sorted(actual_columns),
+                        )
+                        continue
                     LOGGER.info(
-                        "Deferring functions table rebuild to drop legacy columns (found: %s)",
+                        "Recreating table %s due to unexpected columns (expected: %s, found: %s)",
+                        table,
+                        sorted(expected_columns),
                         sorted(actual_columns),
                     )
-                    continue
-                LOGGER.info(
-                    "Recreating table %s due to unexpected columns (expected: %s, found: %s)",
-                    table,
-                    sorted(expected_columns),
-                    sorted(actual_columns),
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    dropped_tables.add(table)
+            if dropped_tables:
+                cursor = self.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'",
                 )
-                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
-                dropped_tables.add(table)
+                remaining_tables = {row["name"] for row in cursor.fetchall()}
+                self._reset_progress_after_schema_changes(dropped_tables, remaining_tables)
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
         self.conn.commit()
-        if dropped_tables:
-            cursor = self.conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'",
-            )
-            remaining_tables = {row["name"] for row in cursor.fetchall()}
-            self._reset_progress_after_schema_changes(dropped_tables, remaining_tables)
 
     def _reset_progress_after_schema_changes(
         self, dropped_tables: Set[str], remaining_tables: Set[str]
     ) -> None:
-        """Update metadata when tables were rebuilt during schema enforcement."""
+        """Update metadata when tables were rebuilt during schema enforcement.
+
+        Runs inside the transaction opened by :meth:`_enforce_schema`.
+        """
 
         metadata_available = "metadata" in remaining_tables
         brands_available = "brands" in remaining_tables
@@ -331,12 +560,8 @@ class DatabaseMixin:
                 LOGGER.info(
                     "Clearing product progress metadata after products table rebuild",
                 )
-                self.conn.execute(
-                    "DELETE FROM metadata WHERE key LIKE 'brand_products_next_offset:%'",
-                )
-                self.conn.execute(
-                    "DELETE FROM metadata WHERE key LIKE 'brand_empty_products:%'",
-                )
+                for prefix in _BRAND_PROGRESS_PREFIXES:
+                    self._delete_metadata_with_prefix(prefix)
 
         detail_tables = {
             "ingredients",
@@ -349,9 +574,6 @@ class DatabaseMixin:
             )
             self.conn.execute("UPDATE products SET details_scraped = 0")
 
-        if dropped_tables:
-            self.conn.commit()
-
     def _batch_commit(self, force: bool = False) -> None:
         """Commit database changes in batches for better performance."""
         
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 import sqlite3
 import time
 import unicodedata
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from urllib import parse
 
+try:  # pragma: no cover - optional dependency safeguard
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fallback to the standard library
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - optional dependency safeguard
     from playwright.sync_api import (
         Error as PlaywrightError,
@@ -24,6 +31,7 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when Playwright missi
 
 from ..constants import (
     COSING_BASE_URL,
+    DETAIL_PREFETCH_WINDOW,
     INGREDIENT_FETCH_ATTEMPTS,
     INGREDIENT_PLACEHOLDER_MARKER,
     PROGRESS_LOG_INTERVAL,
@@ -39,10 +47,181 @@ from ..models import (
     ProductDetails,
     ProductHighlights,
 )
-from ..parser import Node, extract_text, parse_html
+from ..parser import Node, NodeIndex, extract_text, parse_html
 
 LOGGER = logging.getLogger(__name__)
 
+_ALSO_CALLED_SPLIT_RE = re.compile(r"[,;\n]")
+_REGULATION_CODE_RE = re.compile(r"[A-Z0-9/\s,;-]+")
+_REGULATION_SPLIT_RE = re.compile(r"\s+/\s+|,\s*|;\s*")
+_FUNCTION_WORD_SPLIT_RE = re.compile(r"(\W+)")
+_LOOKUP_SEPARATOR_RE = re.compile(r"[^0-9a-z]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _cosing_value_splitter(
+    split_slashes: bool, split_commas: bool, split_semicolons: bool
+) -> Optional["re.Pattern[str]"]:
+    """Return the compiled separator pattern for a CosIng value cell."""
+
+    pattern_parts: List[str] = []
+    if split_slashes:
+        pattern_parts.append(r"\s*/\s*")
+    if split_commas:
+        pattern_parts.append(r",\s*")
+    if split_semicolons:
+        pattern_parts.append(r";\s*")
+    if not pattern_parts:
+        return None
+    return re.compile("|".join(pattern_parts))
+
+
+class _LookupKeyTable(dict):
+    """``str.translate`` table keeping only ``[0-9a-z]``, filled on demand."""
+
+    _KEEP = frozenset("0123456789abcdefghijklmnopqrstuvwxyz")
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        mapped = code_point if chr(code_point) in self._KEEP else None
+        self[code_point] = mapped
+        return mapped
+
+
+_LOOKUP_KEY_TABLE = _LookupKeyTable()
+
+
+@functools.lru_cache(maxsize=8192)
+def _cosing_lookup_key(value: str) -> str:
+    """Return the lowercase alphanumeric skeleton of ``value``.
+
+    CosIng searches compare the same result labels repeatedly, so keys are
+    memoised; ``str.translate`` drops the other characters without a regex.
+    """
+
+    return unicodedata.normalize("NFKC", value).lower().translate(_LOOKUP_KEY_TABLE)
+
+
+@functools.lru_cache(maxsize=8192)
+def _cosing_lookup_words(value: str) -> FrozenSet[str]:
+    """Return the lowercase alphanumeric tokens of ``value``, memoised like keys."""
+
+    tokens = _LOOKUP_SEPARATOR_RE.split(unicodedata.normalize("NFKC", value).lower())
+    return frozenset(token for token in tokens if token)
+
+
+_COSING_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+
+def _abort_cosing_subresource(route: Any) -> None:
+    """Abort CosIng subresource requests that do not affect the scraped DOM."""
+
+    if route.request.resource_type in _COSING_BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+# ``json.dumps`` builds a new encoder on every call with non-default options.
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _dump_json(value: Any) -> str:
+    """Serialise ``value`` into the compact JSON stored in ``*_json`` columns."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:  # pragma: no cover - e.g. lone surrogates
+            pass
+    return _JSON_ENCODE(value)
+
+
+def _load_json(value: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# Change detection happens inside the statement: every write touches
+# ``last_checked_at`` anyway, so the row is rewritten in one pass and only
+# ``last_updated_at`` depends on whether a payload column actually differs.
+# A missing image keeps the stored path.
+_PRODUCT_UPDATE_SQL = """
+    UPDATE products
+    SET last_updated_at = CASE
+            WHEN name IS NOT :name
+                 OR description IS NOT :description
+                 OR image_path IS NOT COALESCE(:image_path, image_path)
+                 OR ingredient_ids_json IS NOT :ingredient_ids_json
+                 OR key_ingredient_ids_json IS NOT :key_ingredient_ids_json
+                 OR other_ingredient_ids_json IS NOT :other_ingredient_ids_json
+                 OR free_tag_ids_json IS NOT :free_tag_ids_json
+                 OR discontinued IS NOT :discontinued
+                 OR replacement_product_url IS NOT :replacement_product_url
+                 OR last_updated_at IS NULL
+                 OR last_updated_at = ''
+            THEN :now
+            ELSE last_updated_at
+        END,
+        name = :name,
+        description = :description,
+        image_path = COALESCE(:image_path, image_path),
+        ingredient_ids_json = :ingredient_ids_json,
+        key_ingredient_ids_json = :key_ingredient_ids_json,
+        other_ingredient_ids_json = :other_ingredient_ids_json,
+        free_tag_ids_json = :free_tag_ids_json,
+        discontinued = :discontinued,
+        replacement_product_url = :replacement_product_url,
+        last_checked_at = :now
+    WHERE id = :product_id
+    """
+
+_INGREDIENT_PAYLOAD_COLUMNS = (
+    "name",
+    "rating_tag",
+    "also_called",
+    "cosing_function_ids_json",
+    "irritancy",
+    "comedogenicity",
+    "details_text",
+    "cosing_cas_numbers_json",
+    "cosing_ec_numbers_json",
+    "cosing_identified_ingredients_json",
+    "cosing_regulation_provisions_json",
+    "quick_facts_json",
+    "proof_references_json",
+)
+
+# The payload columns follow ``id`` and ``last_updated_at`` so a stored row can
+# be compared with the new values as a single tuple slice.
+_INGREDIENT_SELECT_SQL = (
+    "SELECT id, last_updated_at, "
+    + ", ".join(_INGREDIENT_PAYLOAD_COLUMNS)
+    + " FROM ingredients WHERE url = ?"
+)
+
+_INGREDIENT_UPDATE_SQL = """
+    UPDATE ingredients
+    SET name = :name,
+        rating_tag = :rating_tag,
+        also_called = :also_called,
+        cosing_function_ids_json = :cosing_function_ids_json,
+        irritancy = :irritancy,
+        comedogenicity = :comedogenicity,
+        details_text = :details_text,
+        cosing_cas_numbers_json = :cosing_cas_numbers_json,
+        cosing_ec_numbers_json = :cosing_ec_numbers_json,
+        cosing_identified_ingredients_json = :cosing_identified_ingredients_json,
+        cosing_regulation_provisions_json = :cosing_regulation_provisions_json,
+        quick_facts_json = :quick_facts_json,
+        proof_references_json = :proof_references_json,
+        last_checked_at = :last_checked_at,
+        last_updated_at = :last_updated_at
+    WHERE id = :id
+    """
+
 
 class DetailScraperMixin:
     """Handle product details, ingredient parsing and CosIng integration."""
@@ -54,17 +233,24 @@ class DetailScraperMixin:
     _cosing_page: Optional[Any]
     _cosing_playwright_failed: bool
     _cosing_record_cache: "LRUCache"
+    _page_fetch_pool: ThreadPoolExecutor
+    _image_thread_pool: ThreadPoolExecutor
+    _function_id_cache: Dict[str, Tuple[int, str]]
 
     def scrape_product_details(self, *, rescan_all: bool = False) -> None:
         """Download and persist detailed information for each product."""
 
         if rescan_all:
             cursor = self.conn.execute(
-                "SELECT id, brand_id, name, url, details_scraped FROM products ORDER BY id",
+                "SELECT id, brand_id, name, url, details_scraped, etag, last_modified, "
+                "image_path, ingredient_ids_json "
+                "FROM products ORDER BY id",
             )
         else:
             cursor = self.conn.execute(
-                "SELECT id, brand_id, name, url, details_scraped FROM products WHERE details_scraped = 0 ORDER BY id",
+                "SELECT id, brand_id, name, url, details_scraped, etag, last_modified, "
+                "image_path, ingredient_ids_json "
+                "FROM products WHERE details_scraped = 0 ORDER BY id",
             )
         pending_products = cursor.fetchall()
         total_products = len(pending_products)
@@ -75,11 +261,18 @@ class DetailScraperMixin:
             LOGGER.debug("Detail workload: revalidating %s product(s)", total_products)
         else:
             LOGGER.debug("Detail workload: %s product(s) awaiting scraping", total_products)
+        placeholder_ids = self._placeholder_ingredient_ids()
         processed = 0
-        for product in pending_products:
+        # Product pages are downloaded a few entries ahead on worker threads so
+        # network latency overlaps with parsing, ingredient lookups and SQLite
+        # writes, which stay on this thread.
+        prefetched: Dict[int, Future] = {}
+        for index, product in enumerate(pending_products):
             # Check if user requested pause/stop
             if self._should_stop_scraping():
                 LOGGER.info("Scraping paused by user after %s products", processed)
+                for future in prefetched.values():
+                    future.cancel()
                 return
                 
             LOGGER.debug("Fetching product details for %s", product["url"])
@@ -87,38 +280,96 @@ class DetailScraperMixin:
             # Update current product URL in metadata for real-time UI display
             self._set_metadata("current_product_url", product["url"])
             
-            html = self._fetch_html(product["url"])
-            if html is None:
+            for ahead in range(index, min(index + DETAIL_PREFETCH_WINDOW, total_products)):
+                if ahead not in prefetched:
+                    upcoming = pending_products[ahead]
+                    revalidate = self._can_revalidate_product(upcoming, placeholder_ids)
+                    prefetched[ahead] = self._page_fetch_pool.submit(
+                        self._fetch_html_conditional,
+                        upcoming["url"],
+                        etag=upcoming["etag"] if revalidate else None,
+                        last_modified=upcoming["last_modified"] if revalidate else None,
+                    )
+            page = prefetched.pop(index).result()
+            if page is None:
                 LOGGER.warning("Skipping product %s due to download error", product["url"])
                 continue
-            details = self._parse_product_page(html)
-            if not details:
-                LOGGER.warning("Could not parse product page %s", product["url"])
-                continue
-            image_path = self._download_product_image(
-                details.image_url,
-                details.name,
-                product["id"],
-            )
-            self._store_product_details(product["id"], details, image_path)
-            if not product["details_scraped"]:
+            if page.not_modified:
+                LOGGER.debug("Product page %s is unchanged – skipping parse", product["url"])
                 self.conn.execute(
-                    "UPDATE products SET details_scraped = 1 WHERE id = ?",
-                    (product["id"],),
+                    "UPDATE products SET last_checked_at = ? WHERE id = ?",
+                    (self._current_timestamp(), product["id"]),
                 )
-            self.conn.commit()
-            LOGGER.debug("Stored product details for %s", details.name)
+            else:
+                details = self._parse_product_page(page.html)
+                if not details:
+                    LOGGER.warning("Could not parse product page %s", product["url"])
+                    continue
+                # The cover image downloads while the ingredients are resolved.
+                image_future = self._image_thread_pool.submit(
+                    self._download_product_image,
+                    details.image_url,
+                    details.name,
+                    product["id"],
+                )
+                self._store_product_details(product["id"], details, image_future)
+                self.conn.execute(
+                    """
+                    UPDATE products
+                    SET details_scraped = 1, etag = ?, last_modified = ?
+                    WHERE id = ?
+                    """,
+                    (page.etag, page.last_modified, product["id"]),
+                )
+                LOGGER.debug("Stored product details for %s", details.name)
             processed += 1
             
-            # Update progress metadata AFTER successful commit
-            self._set_metadata("progress_details_current_product", str(processed))
-            self._set_metadata("progress_details_total_products", str(total_products))
+            # Progress metadata shares the product's transaction so the
+            # ingredient, product and progress writes land in a single commit
+            self._set_metadata_many(
+                (
+                    ("progress_details_current_product", str(processed)),
+                    ("progress_details_total_products", str(total_products)),
+                ),
+                commit=False,
+            )
+            self.conn.commit()
             if processed % PROGRESS_LOG_INTERVAL == 0 or processed == total_products:
                 self._log_progress("Product", processed, total_products)
         
         # Clear current product URL when done
         self._set_metadata("current_product_url", "")
 
+    def _placeholder_ingredient_ids(self) -> Set[int]:
+        """Return the ids of ingredients stored as download placeholders."""
+
+        cursor = self.conn.execute(
+            "SELECT id FROM ingredients WHERE instr(IFNULL(details_text, ''), ?) > 0",
+            (INGREDIENT_PLACEHOLDER_MARKER,),
+        )
+        return {row[0] for row in cursor}
+
+    def _can_revalidate_product(
+        self, product: sqlite3.Row, placeholder_ids: Set[int]
+    ) -> bool:
+        """Return ``True`` when a ``304`` may keep the stored product details.
+
+        Failed ingredient and cover image downloads are only retried while a
+        product page is processed, so products still missing either are always
+        downloaded in full.
+        """
+
+        if not product["details_scraped"] or product["image_path"] is None:
+            return False
+        if placeholder_ids and product["ingredient_ids_json"]:
+            try:
+                ingredient_ids = _load_json(product["ingredient_ids_json"])
+                if not placeholder_ids.isdisjoint(ingredient_ids):
+                    return False
+            except (TypeError, ValueError):
+                return False
+        return True
+
     # ------------------------------------------------------------------
     # Product detail parsing
     # ------------------------------------------------------------------
@@ -126,25 +377,29 @@ class DetailScraperMixin:
         """Parse a product detail page into structured information."""
 
         root = parse_html(html)
-        product_block = root.find(class_="detailpage") or root
-        name_node = product_block.find(id_="product-title") or root.find(id_="product-title")
-        description_node = (
-            product_block.find(id_="product-details")
-            or root.find(id_="product-details")
+        # Every extractor below queries this one index instead of re-walking
+        # the whole document.
+        index = NodeIndex(root)
+        product_block = index.find(class_="detailpage") or root
+        name_node = index.find(id_="product-title", within=product_block) or index.find(
+            id_="product-title"
         )
+        description_node = index.find(
+            id_="product-details", within=product_block
+        ) or index.find(id_="product-details")
         if not name_node:
             return None
         name = extract_text(name_node)
         description = extract_text(description_node) if description_node else ""
-        image_url = self._extract_product_image(product_block)
-        tooltip_map = self._build_tooltip_index(root)
-        ingredients = self._extract_ingredients(root, tooltip_map)
-        ingredient_functions = self._extract_ingredient_functions(root)
-        highlights = self._extract_highlights(root, tooltip_map)
+        image_url = self._extract_product_image(product_block, index)
+        tooltip_map = self._build_tooltip_index(index)
+        ingredients = self._extract_ingredients(root, index, tooltip_map)
+        ingredient_functions = self._extract_ingredient_functions(index)
+        highlights = self._extract_highlights(index, tooltip_map)
         discontinued = bool(
-            root.find(class_="discontinued") or root.find(class_="product__discontinued")
+            index.find(class_="discontinued") or index.find(class_="product__discontinued")
         )
-        replacement_anchor = root.find(class_="replacement-product")
+        replacement_anchor = index.find(class_="replacement-product")
         replacement_product_url = None
         if replacement_anchor and replacement_anchor.get("href"):
             replacement_product_url = self._absolute_url(replacement_anchor.get("href"))
@@ -159,18 +414,19 @@ class DetailScraperMixin:
             replacement_product_url=replacement_product_url,
         )
 
-    def _extract_product_image(self, product_block: Node) -> Optional[str]:
+    def _extract_product_image(
+        self, product_block: Node, index: NodeIndex
+    ) -> Optional[str]:
         """Return the hero image URL for the product if available."""
 
-        image_container = (
-            product_block.find(class_="product__image")
-            or product_block.find(id_="product-main-image")
-        )
+        image_container = index.find(
+            class_="product__image", within=product_block
+        ) or index.find(id_="product-main-image", within=product_block)
         if not image_container:
             return None
-        img_tag = image_container.find(tag="img")
+        img_tag = index.find(tag="img", within=image_container)
         if not img_tag:
-            sources = image_container.find_all(tag="source")
+            sources = index.find_all(tag="source", within=image_container)
             for source in sources:
                 srcset = source.get("srcset")
                 if not srcset:
@@ -200,26 +456,24 @@ class DetailScraperMixin:
             return self._absolute_url(value)
         return None
 
-    def _build_tooltip_index(self, root: Node) -> Dict[str, Node]:
+    def _build_tooltip_index(self, index: NodeIndex) -> Dict[str, Node]:
         """Map tooltip identifiers to DOM nodes for quick lookup."""
 
         tooltip_map: Dict[str, Node] = {}
-        for tooltip in root.find_all(class_="tooltip-content"):
+        for tooltip in index.find_all(class_="tooltip-content"):
             tooltip_id = tooltip.get("id")
             if tooltip_id:
                 tooltip_map[tooltip_id] = tooltip
         return tooltip_map
 
     def _extract_ingredients(
-        self, root: Node, tooltip_map: Dict[str, Node]
+        self, root: Node, index: NodeIndex, tooltip_map: Dict[str, Node]
     ) -> List[IngredientReference]:
         """Collect ingredient references listed on the product page."""
 
-        container = root.find(id_="product-ingredients") or root
+        container = index.find(id_="product-ingredients") or root
         ingredients: List[IngredientReference] = []
-        for anchor in container.find_all(tag="a"):
-            if "ingred-link" not in anchor.classes():
-                continue
+        for anchor in index.find_all(tag="a", class_="ingred-link", within=container):
             href = anchor.get("href")
             name = extract_text(anchor)
             if not href or not name:
@@ -227,7 +481,7 @@ class DetailScraperMixin:
             tooltip_text = None
             tooltip_link = None
             tooltip_id = None
-            tooltip_span = self._find_tooltip_anchor(anchor)
+            tooltip_span = self._find_tooltip_anchor(anchor, index)
             if tooltip_span:
                 tooltip_id_attr = tooltip_span.get("data-tooltip-content")
                 if tooltip_id_attr:
@@ -235,9 +489,10 @@ class DetailScraperMixin:
             if tooltip_id and tooltip_id in tooltip_map:
                 tooltip_node = tooltip_map[tooltip_id]
                 tooltip_text = extract_text(tooltip_node)
-                link_node = tooltip_node.find(
+                link_node = index.find(
                     tag="a",
                     predicate=lambda n: n.get("href", "").startswith("/ingredients/"),
+                    within=tooltip_node,
                 )
                 if link_node and link_node.get("href"):
                     tooltip_link = self._absolute_url(link_node.get("href"))
@@ -251,27 +506,29 @@ class DetailScraperMixin:
             )
         return ingredients
 
-    def _find_tooltip_anchor(self, node: Node) -> Optional[Node]:
+    def _find_tooltip_anchor(self, node: Node, index: NodeIndex) -> Optional[Node]:
         """Locate the tooltip icon associated with ``node``."""
 
         current = node.parent
         while current is not None:
-            tooltip = current.find(class_="info-circle-ingred-short")
+            tooltip = index.find(class_="info-circle-ingred-short", within=current)
             if tooltip:
                 return tooltip
             if current.tag == "li" or current.tag == "div":
                 break
             current = current.parent
-        return node.parent.find(class_="info-circle-ingred-short") if node.parent else None
+        if not node.parent:
+            return None
+        return index.find(class_="info-circle-ingred-short", within=node.parent)
 
-    def _extract_ingredient_functions(self, root: Node) -> List[IngredientFunction]:
+    def _extract_ingredient_functions(self, index: NodeIndex) -> List[IngredientFunction]:
         """Parse the ingredient function table displayed on the page."""
 
-        section = root.find(id_="ingredlist-table-section")
+        section = index.find(id_="ingredlist-table-section")
         if not section:
             return []
         rows: List[IngredientFunction] = []
-        for tr in section.find_all(tag="tr"):
+        for tr in index.find_all(tag="tr", within=section):
             cells = [
                 child
                 for child in tr.children
@@ -280,9 +537,10 @@ class DetailScraperMixin:
             if len(cells) < 2:
                 continue
             ingred_cell, function_cell = cells[:2]
-            ingred_anchor = ingred_cell.find(
+            ingred_anchor = index.find(
                 tag="a",
                 predicate=lambda n: n.get("href", "").startswith("/ingredients/"),
+                within=ingred_cell,
             )
             if not ingred_anchor:
                 continue
@@ -294,9 +552,9 @@ class DetailScraperMixin:
             )
             what_it_does: List[str] = []
             function_links: List[str] = []
-            for anchor in function_cell.find_all(tag="a"):
-                if "ingred-function-link" not in anchor.classes():
-                    continue
+            for anchor in index.find_all(
+                tag="a", class_="ingred-function-link", within=function_cell
+            ):
                 text = extract_text(anchor)
                 href = anchor.get("href")
                 if text:
@@ -314,34 +572,33 @@ class DetailScraperMixin:
         return rows
 
     def _extract_highlights(
-        self, root: Node, tooltip_map: Dict[str, Node]
+        self, index: NodeIndex, tooltip_map: Dict[str, Node]
     ) -> ProductHighlights:
         """Collect highlight hashtags and ingredient groupings."""
 
-        section = root.find(id_="ingredlist-highlights-section")
+        section = index.find(id_="ingredlist-highlights-section")
         free_tags: List[FreeTag] = []
         key_entries: List[HighlightEntry] = []
         other_entries: List[HighlightEntry] = []
         if section:
-            for node in section.find_all(tag="span"):
-                if node.has_class("hashtag"):
-                    text = extract_text(node)
-                    if not text:
-                        continue
-                    tooltip_text = None
-                    tooltip_attr = node.get("data-tooltip-content")
-                    if tooltip_attr:
-                        tooltip_id = tooltip_attr.lstrip("#")
-                        tooltip_node = tooltip_map.get(tooltip_id)
-                        if tooltip_node:
-                            tooltip_text = self._normalize_whitespace(
-                                extract_text(tooltip_node)
-                            )
-                    free_tags.append(FreeTag(tag=text, tooltip=tooltip_text))
-            for block in section.find_all(tag="div"):
-                if not block.has_class("ingredlist-by-function-block"):
+            for node in index.find_all(tag="span", class_="hashtag", within=section):
+                text = extract_text(node)
+                if not text:
                     continue
-                heading = block.find(tag="h3")
+                tooltip_text = None
+                tooltip_attr = node.get("data-tooltip-content")
+                if tooltip_attr:
+                    tooltip_id = tooltip_attr.lstrip("#")
+                    tooltip_node = tooltip_map.get(tooltip_id)
+                    if tooltip_node:
+                        tooltip_text = self._normalize_whitespace(
+                            extract_text(tooltip_node)
+                        )
+                free_tags.append(FreeTag(tag=text, tooltip=tooltip_text))
+            for block in index.find_all(
+                tag="div", class_="ingredlist-by-function-block", within=section
+            ):
+                heading = index.find(tag="h3", within=block)
                 heading_text = extract_text(heading).lower() if heading else ""
                 target_list: Optional[List[HighlightEntry]] = None
                 if "key ingredients" in heading_text:
@@ -350,17 +607,11 @@ class DetailScraperMixin:
                     target_list = other_entries
                 if target_list is None:
                     continue
-                for span in block.find_all(tag="span"):
-                    ingred_anchor = span.find(
-                        tag="a",
-                        predicate=lambda n: "ingred-link" in n.classes(),
-                    )
+                for span in index.find_all(tag="span", within=block):
+                    ingred_anchor = index.find(tag="a", class_="ingred-link", within=span)
                     if not ingred_anchor:
                         continue
-                    func_anchor = span.find(
-                        tag="a",
-                        predicate=lambda n: "func-link" in n.classes(),
-                    )
+                    func_anchor = index.find(tag="a", class_="func-link", within=span)
                     target_list.append(
                         HighlightEntry(
                             function_name=extract_text(func_anchor) if func_anchor else None,
@@ -384,60 +635,96 @@ class DetailScraperMixin:
     # ------------------------------------------------------------------
     def _store_product_details(
         self,
-        product_id: str,
+        product_id: int,
         details: ProductDetails,
-        image_path: Optional[str],
+        image_path: Union[Optional[str], "Future[Optional[str]]"],
     ) -> None:
-        """Persist the parsed product details and ingredient links."""
+        """Persist the parsed product details and ingredient links.
+
+        ``image_path`` may be a pending download, which is only awaited once
+        the ingredients have been resolved.  Missing ingredient pages (and
+        their CosIng lookups) are downloaded before the first write, so the
+        product's write transaction never stays open across network I/O.
+        """
+
+        known = self._stored_ingredients_by_url(details.ingredients)
+        downloads: Dict[str, "Future[Optional[str]]"] = {}
+        targets = [
+            self._resolve_ingredient(ingredient, known, downloads)
+            for ingredient in details.ingredients
+        ]
+        # Missing pages download together on the page fetch pool; parsing and
+        # CosIng lookups (Playwright is bound to this thread) stay here.
+        fetched: Dict[str, Union[int, IngredientDetails]] = {}
+        for ingredient, target in zip(details.ingredients, targets):
+            if isinstance(target, str) and target not in fetched:
+                fetched[target] = self._scrape_ingredient_page(
+                    ingredient, downloads[target], known.get(target)
+                )
+        if isinstance(image_path, Future):
+            image_path = image_path.result()
 
-        ingredient_ids: List[str] = []
-        ingredient_lookup_by_url: Dict[str, str] = {}
-        ingredient_lookup_by_name: Dict[str, str] = {}
+        ingredient_ids: List[int] = []
+        ingredient_lookup_by_url: Dict[str, int] = {}
+        ingredient_lookup_by_name: Dict[str, int] = {}
+        name_keys: Dict[str, str] = {}
 
         def normalise_url(value: str) -> str:
             return value.rstrip("/").lower()
 
-        for ingredient in details.ingredients:
-            ingredient_id = self._ensure_ingredient(ingredient)
+        def name_key(value: str) -> str:
+            # Highlight entries usually repeat the ingredient names verbatim.
+            key = name_keys.get(value)
+            if key is None:
+                key = self._normalize_whitespace(value).lower()
+                name_keys[value] = key
+            return key
+
+        for ingredient, target in zip(details.ingredients, targets):
+            if isinstance(target, str):
+                resolved = fetched[target]
+                if isinstance(resolved, IngredientDetails):
+                    resolved = self._store_ingredient_details(resolved)
+                    fetched[target] = resolved
+                target = resolved
+            ingredient_id = target
             ingredient.ingredient_id = ingredient_id
             ingredient_ids.append(ingredient_id)
             if ingredient.url:
                 ingredient_lookup_by_url[normalise_url(ingredient.url)] = ingredient_id
-            normalized_name = self._normalize_whitespace(ingredient.name).lower()
+            normalized_name = name_key(ingredient.name)
             if normalized_name:
                 ingredient_lookup_by_name[normalized_name] = ingredient_id
 
-        ingredient_ids_json = json.dumps(
-            ingredient_ids,
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
+        ingredient_ids_json = _dump_json(ingredient_ids)
 
-        def resolve_highlight_ids(entries: List[HighlightEntry]) -> List[str]:
-            resolved: List[str] = []
-            seen: Set[str] = set()
-            for entry in entries:
-                ingredient_id: Optional[str] = None
-                if entry.ingredient_page:
-                    lookup_key = normalise_url(entry.ingredient_page)
-                    ingredient_id = ingredient_lookup_by_url.get(lookup_key)
-                if not ingredient_id and entry.ingredient_name:
-                    name_key = self._normalize_whitespace(entry.ingredient_name).lower()
-                    ingredient_id = ingredient_lookup_by_name.get(name_key)
-                if ingredient_id and ingredient_id not in seen:
-                    resolved.append(ingredient_id)
-                    seen.add(ingredient_id)
-            return resolved
-
-        key_ingredient_ids_json = json.dumps(
-            resolve_highlight_ids(details.highlights.key_ingredients),
-            ensure_ascii=False,
-            separators=(",", ":"),
+        def resolve_highlight_id(entry: HighlightEntry) -> Optional[int]:
+            ingredient_id: Optional[int] = None
+            if entry.ingredient_page:
+                ingredient_id = ingredient_lookup_by_url.get(
+                    normalise_url(entry.ingredient_page)
+                )
+            if not ingredient_id and entry.ingredient_name:
+                ingredient_id = ingredient_lookup_by_name.get(
+                    name_key(entry.ingredient_name)
+                )
+            return ingredient_id
+
+        def resolve_highlight_ids(entries: List[HighlightEntry]) -> List[int]:
+            # ``dict.fromkeys`` keeps the first occurrence of each id in order.
+            return list(
+                dict.fromkeys(
+                    ingredient_id
+                    for ingredient_id in map(resolve_highlight_id, entries)
+                    if ingredient_id
+                )
+            )
+
+        key_ingredient_ids_json = _dump_json(
+            resolve_highlight_ids(details.highlights.key_ingredients)
         )
-        other_ingredient_ids_json = json.dumps(
-            resolve_highlight_ids(details.highlights.other_ingredients),
-            ensure_ascii=False,
-            separators=(",", ":"),
+        other_ingredient_ids_json = _dump_json(
+            resolve_highlight_ids(details.highlights.other_ingredients)
         )
         # Free tags no longer stored in database - frees table removed
         free_tag_ids_json = "[]"
@@ -452,116 +739,114 @@ class DetailScraperMixin:
             "discontinued": 1 if details.discontinued else 0,
             "replacement_product_url": details.replacement_product_url,
         }
-        existing = self.conn.execute(
-            """
-            SELECT name, description, image_path, ingredient_ids_json,
-                   key_ingredient_ids_json, other_ingredient_ids_json,
-                   free_tag_ids_json, discontinued, replacement_product_url,
-                   last_updated_at
-            FROM products
-            WHERE id = ?
-            """,
-            (product_id,),
-        ).fetchone()
-        now = self._current_timestamp()
-        if image_path is None and existing and existing["image_path"]:
-            payload["image_path"] = existing["image_path"]
-        if existing is None:
-            self.conn.execute(
-                """
-                UPDATE products
-                SET name = :name,
-                    description = :description,
-                    image_path = :image_path,
-                    ingredient_ids_json = :ingredient_ids_json,
-                    key_ingredient_ids_json = :key_ingredient_ids_json,
-                    other_ingredient_ids_json = :other_ingredient_ids_json,
-                    free_tag_ids_json = :free_tag_ids_json,
-                    discontinued = :discontinued,
-                    replacement_product_url = :replacement_product_url,
-                    last_checked_at = :last_checked_at,
-                    last_updated_at = :last_updated_at
-                WHERE id = :product_id
-                """,
-                {
-                    **payload,
-                    "product_id": product_id,
-                    "last_checked_at": now,
-                    "last_updated_at": now,
-                },
-            )
-            return
+        self.conn.execute(
+            _PRODUCT_UPDATE_SQL,
+            {
+                **payload,
+                "product_id": product_id,
+                "now": self._current_timestamp(),
+            },
+        )
 
-        changed = False
-        for column, value in payload.items():
-            if existing[column] != value:
-                changed = True
-                break
-        if changed or not existing["last_updated_at"]:
-            update_values = {**payload, "last_checked_at": now, "last_updated_at": now}
-            assignments = ", ".join(f"{column} = ?" for column in update_values)
-            params = list(update_values.values()) + [product_id]
-            self.conn.execute(
-                f"UPDATE products SET {assignments} WHERE id = ?",
-                params,
-            )
-        else:
-            self.conn.execute(
-                "UPDATE products SET last_checked_at = ? WHERE id = ?",
-                (now, product_id),
-            )
+    def _stored_ingredients_by_url(
+        self, ingredients: List[IngredientReference]
+    ) -> Dict[str, Tuple[int, bool]]:
+        """Map the product's ingredient URLs to ``(id, is_placeholder)``.
+
+        One ``url IN (...)`` query covers the ingredient and tooltip links of
+        a whole product page; the placeholder marker is tested in SQL so the
+        stored details text never leaves the database.
+        """
+
+        urls = {ingredient.url for ingredient in ingredients}
+        urls.update(
+            ingredient.tooltip_ingredient_link
+            for ingredient in ingredients
+            if ingredient.tooltip_ingredient_link
+        )
+        if not urls:
+            return {}
+        placeholders = ", ".join("?" for _ in urls)
+        rows = self.conn.execute(
+            f"""
+            SELECT url, id, instr(IFNULL(details_text, ''), ?) > 0
+            FROM ingredients
+            WHERE url IN ({placeholders})
+            """,
+            (INGREDIENT_PLACEHOLDER_MARKER, *urls),
+        )
+        return {
+            url: (ingredient_id, bool(placeholder))
+            for url, ingredient_id, placeholder in rows
+        }
 
-    def _ensure_ingredient(self, ingredient: IngredientReference) -> str:
-        """Persist ingredient metadata and return the database identifier."""
+    def _resolve_ingredient(
+        self,
+        ingredient: IngredientReference,
+        known: Dict[str, Tuple[int, bool]],
+        downloads: Dict[str, "Future[Optional[str]]"],
+    ) -> Union[int, str]:
+        """Return the stored id for ``ingredient`` or the URL being downloaded.
+
+        Nothing is written here.  ``known`` holds the stored rows from
+        :meth:`_stored_ingredients_by_url`.  Pages that still need downloading
+        are submitted to the page fetch pool and recorded in ``downloads``
+        (keyed by URL, shared across one product so repeated ingredients are
+        fetched once); their URL is returned for
+        :meth:`_scrape_ingredient_page` to parse afterwards.
+        """
 
         if ingredient.tooltip_ingredient_link:
-            row = self.conn.execute(
-                "SELECT id FROM ingredients WHERE url = ?",
-                (ingredient.tooltip_ingredient_link,),
-            ).fetchone()
-            if row:
-                return str(row["id"])
-        row = self.conn.execute(
-            "SELECT id, details_text FROM ingredients WHERE url = ?",
-            (ingredient.url,),
-        ).fetchone()
-        if row and not self._is_placeholder_details(row["details_text"] or ""):
-            return str(row["id"])
+            if ingredient.tooltip_ingredient_link in downloads:
+                return ingredient.tooltip_ingredient_link
+            stored = known.get(ingredient.tooltip_ingredient_link)
+            if stored:
+                return stored[0]
+        if ingredient.url in downloads:
+            return ingredient.url
+        row = known.get(ingredient.url)
+        if row and not row[1]:
+            return row[0]
         if row:
             LOGGER.debug(
                 "Previously stored placeholder for %s – retrying download", ingredient.url
             )
-        try:
-            details = self._scrape_ingredient_page(ingredient.url)
-        except RuntimeError as exc:
-            LOGGER.error("Unable to download ingredient %s: %s", ingredient.url, exc)
-            if row:
-                return str(row["id"])
-            placeholder = self._build_placeholder_ingredient_details(ingredient, str(exc))
-            return self._store_ingredient_details(placeholder)
-        return self._store_ingredient_details(details)
+        LOGGER.debug("Fetching ingredient details %s", ingredient.url)
+        downloads[ingredient.url] = self._page_fetch_pool.submit(
+            self._fetch_html, ingredient.url, attempts=INGREDIENT_FETCH_ATTEMPTS
+        )
+        return ingredient.url
 
     # _ensure_free_tag method removed - frees table no longer exists
 
     # ------------------------------------------------------------------
     # Ingredient scraping & persistence
     # ------------------------------------------------------------------
-    def _scrape_ingredient_page(self, url: str) -> IngredientDetails:
-        """Download and parse a single ingredient page."""
-
-        LOGGER.debug("Fetching ingredient details %s", url)
-        html = self._fetch_html(url, attempts=INGREDIENT_FETCH_ATTEMPTS)
-        if html is None:
-            raise RuntimeError(
-                f"Unable to download ingredient page {url} after {INGREDIENT_FETCH_ATTEMPTS} attempts"
-            )
-        return self._parse_ingredient_page(html, url)
+    def _scrape_ingredient_page(
+        self,
+        ingredient: IngredientReference,
+        download: "Future[Optional[str]]",
+        row: Optional[Tuple[int, bool]],
+    ) -> Union[int, IngredientDetails]:
+        """Parse a downloaded ingredient page.
 
-    @staticmethod
-    def _is_placeholder_details(details_text: str) -> bool:
-        """Return ``True`` when ``details_text`` represents a placeholder entry."""
+        When the download failed, the stored id in ``row`` is kept if there
+        is one; otherwise placeholder details are returned for storage.
+        """
 
-        return INGREDIENT_PLACEHOLDER_MARKER in details_text
+        url = ingredient.url
+        try:
+            html = download.result()
+            if html is None:
+                raise RuntimeError(
+                    f"Unable to download ingredient page {url} after {INGREDIENT_FETCH_ATTEMPTS} attempts"
+                )
+            return self._parse_ingredient_page(html, url)
+        except RuntimeError as exc:
+            LOGGER.error("Unable to download ingredient %s: %s", url, exc)
+            if row:
+                return row[0]
+            return self._build_placeholder_ingredient_details(ingredient, str(exc))
 
     def _build_placeholder_ingredient_details(
         self, ingredient: IngredientReference, reason: str
@@ -605,12 +890,14 @@ class DetailScraperMixin:
     def _parse_ingredient_page(self, html: str, url: str) -> IngredientDetails:
         """Convert ingredient HTML into a structured :class:`IngredientDetails`."""
 
-        root = parse_html(html)
-        name_node = root.find(tag="h1", class_="klavikab") or root.find(tag="h1")
-        rating_node = root.find(class_="ourtake")
-        name = extract_text(name_node)
-        rating_tag = extract_text(rating_node)
-        label_map = self._build_label_map(root)
+        # As on product pages, one index serves every lookup below.
+        index = NodeIndex(parse_html(html))
+        text_cache: Dict[int, str] = {}
+        name_node = index.find(tag="h1", class_="klavikab") or index.find(tag="h1")
+        rating_node = index.find(class_="ourtake")
+        name = self._node_text(name_node, text_cache)
+        rating_tag = self._node_text(rating_node, text_cache)
+        label_map = self._build_label_map(index, text_cache)
         also_called_node = label_map.get("also-called-like-this")
         irritancy_node = label_map.get("irritancy")
         comedogenicity_node = label_map.get("comedogenicity")
@@ -619,13 +906,13 @@ class DetailScraperMixin:
             IngredientFunctionInfo(name=fn, url=None, description="")
             for fn in cosing_record.functions
         ]
-        details_text = self._parse_details_text(root)
-        quick_facts = self._parse_quick_facts(root)
-        proof_references = self._parse_proof_references(root)
-        raw_also_called = extract_text(also_called_node) if also_called_node else ""
+        details_text = self._parse_details_text(index)
+        quick_facts = self._parse_list_section(index, "quickfacts")
+        proof_references = self._parse_list_section(index, "proof")
+        raw_also_called = self._node_text(also_called_node, text_cache)
         also_called_values: List[str] = []
         if raw_also_called:
-            for part in re.split(r"[,;\n]", raw_also_called):
+            for part in _ALSO_CALLED_SPLIT_RE.split(raw_also_called):
                 candidate = self._normalize_whitespace(part)
                 if candidate and candidate not in also_called_values:
                     also_called_values.append(candidate)
@@ -634,8 +921,8 @@ class DetailScraperMixin:
             url=url,
             rating_tag=rating_tag,
             also_called=also_called_values,
-            irritancy=self._extract_label_text(irritancy_node),
-            comedogenicity=self._extract_label_text(comedogenicity_node),
+            irritancy=self._extract_label_text(irritancy_node, text_cache),
+            comedogenicity=self._extract_label_text(comedogenicity_node, text_cache),
             details_text=details_text,
             cosing_cas_numbers=cosing_record.cas_numbers,
             cosing_ec_numbers=cosing_record.ec_numbers,
@@ -782,7 +1069,7 @@ class DetailScraperMixin:
                 LOGGER.debug("CosIng search results did not reach idle state", exc_info=True)
         self._wait_for_cosing_dynamic_content(page)
         html = page.content()
-        root = parse_html(html)
+        root = self._parse_html_cached(html)
         if self._is_cosing_detail_page(root):
             return html
         expected_name = None
@@ -825,7 +1112,7 @@ class DetailScraperMixin:
                 LOGGER.debug("CosIng detail page did not reach idle state", exc_info=True)
         self._wait_for_cosing_dynamic_content(page)
         detail_html = page.content()
-        detail_root = parse_html(detail_html)
+        detail_root = self._parse_html_cached(detail_html)
         if self._is_cosing_detail_page(detail_root):
             return detail_html
         return None
@@ -879,6 +1166,8 @@ class DetailScraperMixin:
                 viewport={'width': 1280, 'height': 720},
                 ignore_https_errors=True,
             )
+            # Only the DOM is scraped, so skip images, styles and fonts.
+            self._cosing_context.route("**/*", _abort_cosing_subresource)
             self._cosing_page = self._cosing_context.new_page()
             # Set shorter timeouts for faster failure detection
             self._cosing_page.set_default_timeout(10000)  # 10 seconds instead of default 30
@@ -913,12 +1202,15 @@ class DetailScraperMixin:
         expected_words = (
             self._cosing_lookup_words(expected_name)
             if expected_name
-            else set()
+            else frozenset()
         )
         best_rank: Tuple[int, int] = (4, 0)
         best_anchor: Optional[Node] = None
         exact_target_rank: Tuple[int, int] = (4, 0)
         exact_target_anchor: Optional[Node] = None
+        # A result row usually holds several anchors; its text, key and words
+        # are computed once per row.
+        row_cache: Dict[int, Tuple[str, FrozenSet[str]]] = {}
         for index, anchor in enumerate(table.find_all(tag="a")):
             href = anchor.get("href")
             if not href:
@@ -930,17 +1222,22 @@ class DetailScraperMixin:
                     best_anchor = anchor
                 continue
             anchor_key = self._cosing_lookup_key(anchor_text)
+            anchor_words = self._cosing_lookup_words(anchor_text)
             row_node = anchor
             while row_node and row_node.tag != "tr":
                 row_node = row_node.parent
-            row_text = (
-                self._normalize_whitespace(extract_text(row_node))
-                if row_node
-                else anchor_text
-            )
-            row_key = self._cosing_lookup_key(row_text)
-            anchor_words = self._cosing_lookup_words(anchor_text)
-            row_words = self._cosing_lookup_words(row_text)
+            if row_node is None:
+                row_key, row_words = anchor_key, anchor_words
+            else:
+                cached_row = row_cache.get(id(row_node))
+                if cached_row is None:
+                    row_text = self._normalize_whitespace(extract_text(row_node))
+                    cached_row = (
+                        self._cosing_lookup_key(row_text),
+                        self._cosing_lookup_words(row_text),
+                    )
+                    row_cache[id(row_node)] = cached_row
+                row_key, row_words = cached_row
             if expected_key:
                 if anchor_key == expected_key or row_key == expected_key:
                     return anchor
@@ -1003,11 +1300,12 @@ class DetailScraperMixin:
     def _parse_cosing_detail_page(self, html: str) -> CosIngRecord:
         """Parse the CosIng detail HTML page into a :class:`CosIngRecord`."""
 
-        root = parse_html(html)
+        root = self._parse_html_cached(html)
         table_body = root.find(tag="tbody")
         if not table_body:
             return CosIngRecord()
         record = CosIngRecord()
+        text_cache: Dict[int, str] = {}
         for row in table_body.find_all(tag="tr"):
             cells = [
                 child
@@ -1016,7 +1314,7 @@ class DetailScraperMixin:
             ]
             if len(cells) < 2:
                 continue
-            label = self._normalize_whitespace(extract_text(cells[0])).lower()
+            label = self._node_text(cells[0], text_cache).lower()
             value_node = cells[1]
             if label == "cas #":
                 record.cas_numbers = self._extract_cosing_values(
@@ -1040,12 +1338,11 @@ class DetailScraperMixin:
                 if record.regulation_provisions:
                     if len(record.regulation_provisions) == 1:
                         single_value = record.regulation_provisions[0]
-                        if re.fullmatch(r"[A-Z0-9/\s,;-]+", single_value):
+                        if _REGULATION_CODE_RE.fullmatch(single_value):
                             parts = [
                                 part.strip()
-                                for part in re.split(
-                                    r"\s+/\s+|,\s*|;\s*",
-                                    single_value,
+                                for part in _REGULATION_SPLIT_RE.split(
+                                    single_value
                                 )
                                 if part.strip()
                             ]
@@ -1080,16 +1377,11 @@ class DetailScraperMixin:
         else:
             raw_text = self._normalize_whitespace(extract_text(node))
             if raw_text:
-                pattern_parts: List[str] = []
-                if split_slashes:
-                    pattern_parts.append(r"\s*/\s*")
-                if split_commas:
-                    pattern_parts.append(r",\s*")
-                if split_semicolons:
-                    pattern_parts.append(r";\s*")
-                if pattern_parts:
-                    pattern = "|".join(pattern_parts)
-                    fragments = re.split(pattern, raw_text)
+                splitter = _cosing_value_splitter(
+                    split_slashes, split_commas, split_semicolons
+                )
+                if splitter is not None:
+                    fragments = splitter.split(raw_text)
                 else:
                     fragments = [raw_text]
                 for part in fragments:
@@ -1109,7 +1401,7 @@ class DetailScraperMixin:
     def _normalise_cosing_function_name(self, value: str) -> str:
         """Return the CosIng function name with each word capitalised."""
 
-        parts = re.split(r"(\W+)", value.strip())
+        parts = _FUNCTION_WORD_SPLIT_RE.split(value.strip())
         normalised: List[str] = []
         for part in parts:
             if not part:
@@ -1132,26 +1424,38 @@ class DetailScraperMixin:
     def _cosing_lookup_key(self, value: str) -> str:
         """Return a simplified representation suitable for equality checks."""
 
-        normalized = unicodedata.normalize("NFKC", value)
-        simplified = re.sub(r"[^0-9a-z]+", "", normalized.lower())
-        return simplified
+        return _cosing_lookup_key(value)
 
-    def _cosing_lookup_words(self, value: str) -> Set[str]:
+    def _cosing_lookup_words(self, value: str) -> FrozenSet[str]:
         """Break a CosIng label into comparable lowercase tokens."""
 
-        normalized = unicodedata.normalize("NFKC", value)
-        tokens = re.split(r"[^0-9a-z]+", normalized.lower())
-        return {token for token in tokens if token}
+        return _cosing_lookup_words(value)
 
-    def _build_label_map(self, root: Node) -> Dict[str, Node]:
+    def _node_text(self, node: Optional[Node], text_cache: Dict[int, str]) -> str:
+        """Return the normalised text of ``node``, memoised for one parsed page."""
+
+        if node is None:
+            return ""
+        key = id(node)
+        text = text_cache.get(key)
+        if text is None:
+            text = self._normalize_whitespace(extract_text(node))
+            text_cache[key] = text
+        return text
+
+    def _build_label_map(
+        self, index: NodeIndex, text_cache: Optional[Dict[int, str]] = None
+    ) -> Dict[str, Node]:
         """Associate label slugs with their corresponding value nodes."""
 
         label_map: Dict[str, Node] = {}
+        if text_cache is None:
+            text_cache = {}
 
         def register(label_node: Optional[Node], value_node: Optional[Node]) -> None:
             if not label_node or not value_node:
                 return
-            label_text = self._normalize_whitespace(extract_text(label_node))
+            label_text = self._node_text(label_node, text_cache)
             if not label_text:
                 return
             slug = label_text.lower().rstrip(":")
@@ -1161,17 +1465,21 @@ class DetailScraperMixin:
                 label_map[slug] = value_node
 
         # Newer markup renders metadata rows with generic ``itemprop`` containers.
-        for container in root.find_all(class_="itemprop"):
-            label_node = container.find(class_="label")
-            value_node = container.find(class_="value")
+        for container in index.find_all(class_="itemprop"):
+            label_node = index.find(class_="label", within=container)
+            value_node = index.find(class_="value", within=container)
             if not value_node:
                 value_node = self._find_value_node(label_node)
             register(label_node, value_node or container)
 
         # Legacy markup used a dedicated BEM style grid.
-        for row in root.find_all(class_="ingredient-overview__row"):
-            label_node = row.find(class_="ingredient-overview__row-title")
-            value_node = row.find(class_="ingredient-overview__row-content")
+        for row in index.find_all(class_="ingredient-overview__row"):
+            label_node = index.find(
+                class_="ingredient-overview__row-title", within=row
+            )
+            value_node = index.find(
+                class_="ingredient-overview__row-content", within=row
+            )
             register(label_node, value_node or row)
         return label_map
 
@@ -1189,7 +1497,9 @@ class DetailScraperMixin:
                 return child
         return None
 
-    def _extract_label_text(self, node: Optional[Node]) -> str:
+    def _extract_label_text(
+        self, node: Optional[Node], text_cache: Optional[Dict[int, str]] = None
+    ) -> str:
         """Return the textual content of a label field."""
 
         if node is None:
@@ -1200,18 +1510,21 @@ class DetailScraperMixin:
             if value_node is None:
                 return ""
             target = value_node
-        return self._normalize_whitespace(extract_text(target))
+        return self._node_text(target, {} if text_cache is None else text_cache)
 
-    def _parse_details_text(self, root: Node) -> str:
+    def _parse_details_text(self, index: NodeIndex) -> str:
         """Return the prose detail block as a clean string."""
 
-        content_node = root.find(id_="details-text")
+        content_node = index.find(id_="details-text")
         if not content_node:
-            details_section = root.find(id_="details")
+            details_section = index.find(id_="details")
             if details_section:
-                content_node = details_section.find(class_="content") or details_section
+                content_node = (
+                    index.find(class_="content", within=details_section)
+                    or details_section
+                )
         if not content_node:
-            content_node = root.find(class_="detailmore")
+            content_node = index.find(class_="detailmore")
         if not content_node:
             return ""
         blocks: List[str] = []
@@ -1250,220 +1563,153 @@ class DetailScraperMixin:
             return text
         return "\n\n".join(blocks)
 
-    def _parse_quick_facts(self, root: Node) -> List[str]:
-        """Return the bullet point quick facts section as a list of strings."""
-
-        section = root.find(id_="quickfacts")
-        if not section:
-            return []
-        facts: List[str] = []
-        for item in section.find_all(tag="li"):
-            text = self._normalize_whitespace(extract_text(item))
-            if text:
-                facts.append(text)
-        return facts
+    def _parse_list_section(self, index: NodeIndex, section_id: str) -> List[str]:
+        """Return the non-empty list items of the section with ``section_id``.
 
-    def _parse_proof_references(self, root: Node) -> List[str]:
-        """Collect the bibliography style entries from the proof section."""
+        Used for the quick facts bullets and the proof bibliography.
+        """
 
-        section = root.find(id_="proof")
+        section = index.find(id_=section_id)
         if not section:
             return []
-        references: List[str] = []
-        for item in section.find_all(tag="li"):
+        items: List[str] = []
+        for item in index.find_all(tag="li", within=section):
             text = self._normalize_whitespace(extract_text(item))
             if text:
-                references.append(text)
-        return references
+                items.append(text)
+        return items
 
-    def _store_ingredient_details(self, details: IngredientDetails) -> str:
+    def _store_ingredient_details(self, details: IngredientDetails) -> int:
         """Persist ingredient metadata and return the database identifier."""
 
-        cosing_function_ids: List[str] = []
+        cosing_function_ids: List[int] = []
         for function in details.cosing_function_infos:
             function_id = self._ensure_ingredient_function(function)
             if function_id is not None:
                 cosing_function_ids.append(function_id)
+        existing = self.conn.execute(
+            _INGREDIENT_SELECT_SQL, (details.url,)
+        ).fetchone()
+
+        def encode(column: str, values: List[str]) -> str:
+            # Re-scrapes mostly yield identical lists, so reuse the stored
+            # JSON text instead of serialising the same value again.
+            if existing is not None:
+                stored = existing[column]
+                if stored is not None:
+                    try:
+                        if _load_json(stored) == values:
+                            return stored
+                    except ValueError:
+                        pass
+            return _dump_json(values)
+
         payload: Dict[str, object] = {
             "name": details.name,
             "rating_tag": details.rating_tag,
-            "also_called": json.dumps(
-                details.also_called,
-                ensure_ascii=False,
-                separators=(",", ":"),
-            ),
-            "cosing_function_ids_json": json.dumps(
-                cosing_function_ids,
-                ensure_ascii=False,
-                separators=(",", ":"),
+            "also_called": encode("also_called", details.also_called),
+            "cosing_function_ids_json": encode(
+                "cosing_function_ids_json", cosing_function_ids
             ),
             "irritancy": details.irritancy,
             "comedogenicity": details.comedogenicity,
             "details_text": details.details_text,
-            "cosing_cas_numbers_json": json.dumps(
-                details.cosing_cas_numbers,
-                ensure_ascii=False,
-                separators=(",", ":"),
+            "cosing_cas_numbers_json": encode(
+                "cosing_cas_numbers_json", details.cosing_cas_numbers
             ),
-            "cosing_ec_numbers_json": json.dumps(
-                details.cosing_ec_numbers,
-                ensure_ascii=False,
-                separators=(",", ":"),
+            "cosing_ec_numbers_json": encode(
+                "cosing_ec_numbers_json", details.cosing_ec_numbers
             ),
-            "cosing_identified_ingredients_json": json.dumps(
+            "cosing_identified_ingredients_json": encode(
+                "cosing_identified_ingredients_json",
                 details.cosing_identified_ingredients,
-                ensure_ascii=False,
-                separators=(",", ":"),
             ),
-            "cosing_regulation_provisions_json": json.dumps(
+            "cosing_regulation_provisions_json": encode(
+                "cosing_regulation_provisions_json",
                 details.cosing_regulation_provisions,
-                ensure_ascii=False,
-                separators=(",", ":"),
             ),
-            "quick_facts_json": json.dumps(
-                details.quick_facts,
-                ensure_ascii=False,
-                separators=(",", ":"),
-            ),
-            "proof_references_json": json.dumps(
-                details.proof_references,
-                ensure_ascii=False,
-                separators=(",", ":"),
+            "quick_facts_json": encode("quick_facts_json", details.quick_facts),
+            "proof_references_json": encode(
+                "proof_references_json", details.proof_references
             ),
         }
-        existing = self.conn.execute(
-            """
-            SELECT id, name, rating_tag, also_called, cosing_function_ids_json,
-                   irritancy, comedogenicity, details_text, cosing_cas_numbers_json,
-                   cosing_ec_numbers_json, cosing_identified_ingredients_json,
-                   cosing_regulation_provisions_json, quick_facts_json,
-                   proof_references_json, last_updated_at
-            FROM ingredients
-            WHERE url = ?
-            """,
-            (details.url,),
-        ).fetchone()
         now = self._current_timestamp()
-        result_id: Optional[str]
         if existing is None:
-            while True:
-                ingredient_id = self._generate_id()
-                try:
-                    self.conn.execute(
-                        """
-                        INSERT INTO ingredients (
-                            id, name, url, rating_tag, also_called, cosing_function_ids_json,
-                            irritancy, comedogenicity, details_text, cosing_cas_numbers_json,
-                            cosing_ec_numbers_json, cosing_identified_ingredients_json,
-                            cosing_regulation_provisions_json, quick_facts_json,
-                            proof_references_json, last_checked_at, last_updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            ingredient_id,
-                            details.name,
-                            details.url,
-                            details.rating_tag,
-                            payload["also_called"],
-                            payload["cosing_function_ids_json"],
-                            details.irritancy,
-                            details.comedogenicity,
-                            details.details_text,
-                            payload["cosing_cas_numbers_json"],
-                            payload["cosing_ec_numbers_json"],
-                            payload["cosing_identified_ingredients_json"],
-                            payload["cosing_regulation_provisions_json"],
-                            payload["quick_facts_json"],
-                            payload["proof_references_json"],
-                            now,
-                            now,
-                        ),
+            insert_sql = """
+                INSERT INTO ingredients (
+                    name, url, rating_tag, also_called, cosing_function_ids_json,
+                    irritancy, comedogenicity, details_text, cosing_cas_numbers_json,
+                    cosing_ec_numbers_json, cosing_identified_ingredients_json,
+                    cosing_regulation_provisions_json, quick_facts_json,
+                    proof_references_json, last_checked_at, last_updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """
+            insert_values = (
+                details.name,
+                details.url,
+                details.rating_tag,
+                payload["also_called"],
+                payload["cosing_function_ids_json"],
+                details.irritancy,
+                details.comedogenicity,
+                details.details_text,
+                payload["cosing_cas_numbers_json"],
+                payload["cosing_ec_numbers_json"],
+                payload["cosing_identified_ingredients_json"],
+                payload["cosing_regulation_provisions_json"],
+                payload["quick_facts_json"],
+                payload["proof_references_json"],
+                now,
+                now,
+            )
+            try:
+                result_id = self.conn.execute(insert_sql, insert_values).lastrowid
+            except sqlite3.IntegrityError as exc:  # pragma: no cover - defensive
+                if "ingredients.url" in str(exc):
+                    LOGGER.debug(
+                        "Ingredient URL %s already exists, fetching existing record",
+                        details.url,
                     )
-                except sqlite3.IntegrityError as exc:  # pragma: no cover - rare collision
-                    exc_str = str(exc)
-                    if "ingredients.id" in exc_str:
-                        # ID collision, try again with new ID
-                        continue
-                    elif "ingredients.url" in exc_str:
-                        # URL already exists (race condition), fetch existing record
-                        LOGGER.debug("Ingredient URL %s already exists, fetching existing record", details.url)
-                        existing = self.conn.execute(
-                            """
-                            SELECT id, name, rating_tag, also_called, cosing_function_ids_json,
-                                   irritancy, comedogenicity, details_text, cosing_cas_numbers_json,
-                                   cosing_ec_numbers_json, cosing_identified_ingredients_json,
-                                   cosing_regulation_provisions_json, quick_facts_json,
-                                   proof_references_json, last_updated_at
-                            FROM ingredients
-                            WHERE url = ?
-                            """,
-                            (details.url,),
-                        ).fetchone()
-                        if existing:
-                            # Update existing record instead
-                            changed = False
-                            for column, value in payload.items():
-                                if existing[column] != value:
-                                    changed = True
-                                    break
-                            if changed or not existing["last_updated_at"]:
-                                update_values = {**payload, "last_checked_at": now, "last_updated_at": now}
-                                assignments = ", ".join(f"{column} = ?" for column in update_values)
-                                params = list(update_values.values()) + [existing["id"]]
-                                self.conn.execute(
-                                    f"UPDATE ingredients SET {assignments} WHERE id = ?",
-                                    params,
-                                )
-                            else:
-                                self.conn.execute(
-                                    "UPDATE ingredients SET last_checked_at = ? WHERE id = ?",
-                                    (now, existing["id"]),
-                                )
-                            result_id = str(existing["id"])
-                            break
-                        else:
-                            # Record disappeared, try INSERT again
-                            continue
-                    else:
-                        # Unknown integrity error, re-raise
+                    existing = self.conn.execute(
+                        _INGREDIENT_SELECT_SQL, (details.url,)
+                    ).fetchone()
+                    if existing is None:
                         raise
-                # Successful INSERT
-                result_id = ingredient_id
-                break
-        else:
-            changed = False
-            for column, value in payload.items():
-                if existing[column] != value:
-                    changed = True
-                    break
-            if changed or not existing["last_updated_at"]:
-                update_values = {**payload, "last_checked_at": now, "last_updated_at": now}
-                assignments = ", ".join(f"{column} = ?" for column in update_values)
-                params = list(update_values.values()) + [existing["id"]]
+                else:
+                    raise
+        if existing is not None:
+            stored_values = tuple(existing)[2:]
+            payload_values = tuple(payload[column] for column in _INGREDIENT_PAYLOAD_COLUMNS)
+            if stored_values != payload_values or not existing["last_updated_at"]:
                 self.conn.execute(
-                    f"UPDATE ingredients SET {assignments} WHERE id = ?",
-                    params,
+                    _INGREDIENT_UPDATE_SQL,
+                    {
+                        **payload,
+                        "id": existing["id"],
+                        "last_checked_at": now,
+                        "last_updated_at": now,
+                    },
                 )
             else:
                 self.conn.execute(
                     "UPDATE ingredients SET last_checked_at = ? WHERE id = ?",
                     (now, existing["id"]),
                 )
-            result_id = str(existing["id"])
-        row = self.conn.execute(
-            "SELECT id FROM ingredients WHERE url = ?",
-            (details.url,),
-        ).fetchone()
-        if not row:
-            raise RuntimeError(f"Unable to store ingredient {details.url}")
+            result_id = existing["id"]
         return result_id
 
-    def _ensure_ingredient_function(self, info: IngredientFunctionInfo) -> Optional[str]:
+    def _ensure_ingredient_function(self, info: IngredientFunctionInfo) -> Optional[int]:
         """Ensure an ingredient function entry exists and return its id."""
 
         raw_name = self._normalize_whitespace(info.name)
         if not raw_name:
             return None
+        # Only a few hundred distinct functions exist, so resolved ids are kept
+        # in memory keyed by the lowercased name together with the stored name.
+        cache_key = raw_name.lower()
+        cached = self._function_id_cache.get(cache_key)
+        if cached is not None and cached[1] == raw_name:
+            return cached[0]
         row = self.conn.execute(
             """
             SELECT id, name
@@ -1479,19 +1725,14 @@ class DetailScraperMixin:
                     "UPDATE functions SET name = ? WHERE id = ?",
                     (raw_name, row["id"]),
                 )
-            return str(row["id"])
-        while True:
-            function_id = self._generate_id()
-            try:
-                self.conn.execute(
-                    "INSERT INTO functions (id, name) VALUES (?, ?)",
-                    (function_id, raw_name),
-                )
-            except sqlite3.IntegrityError as exc:  # pragma: no cover - rare id collision
-                if "functions.id" in str(exc):
-                    continue
-                raise
-            return function_id
+            function_id = row["id"]
+        else:
+            function_id = self.conn.execute(
+                "INSERT INTO functions (name) VALUES (?)",
+                (raw_name,),
+            ).lastrowid
+        self._function_id_cache[cache_key] = (function_id, raw_name)
+        return function_id
 
     # ------------------------------------------------------------------
     # Resource management
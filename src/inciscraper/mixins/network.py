@@ -8,12 +8,19 @@ import logging
 import os
 import socket
 import ssl
+import threading
 import time
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from email.message import Message
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from urllib import error, parse, request
 
+try:  # pragma: no cover - optional dependency safeguard
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fallback to the standard library
+    orjson = None  # type: ignore[assignment]
+
 try:
     from PIL import Image, ImageFile
 except ModuleNotFoundError:  # pragma: no cover - optional dependency safeguard
@@ -27,6 +34,40 @@ from ..constants import USER_AGENT
 
 LOGGER = logging.getLogger(__name__)
 
+_HTTP_POOL_MAXSIZE = 4
+_HTTP_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_DOH_CACHE_TTL = 300.0  # fallback lifetime when a DoH answer carries no TTL
+# WebP effort level: 6 is several times slower than 4 for a marginal size gain.
+_WEBP_METHOD = 4
+_WEBP_PASSTHROUGH_BYTES = 200_000
+# Re-encoding a small JPEG at quality 85 saves little and costs a full decode.
+_JPEG_PASSTHROUGH_BYTES = 150_000
+_EXTENSION_FORMATS = {
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "png": "PNG",
+    "gif": "GIF",
+    "webp": "WEBP",
+}
+
+
+def _load_json(data: bytes) -> Dict[str, object]:
+    """Parse a JSON response body, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+class HTMLPage(NamedTuple):
+    """Result of a conditional HTML download."""
+
+    html: Optional[str]
+    not_modified: bool
+    etag: Optional[str]
+    last_modified: Optional[str]
+
 
 class NetworkMixin:
     """Provide HTTP helpers with host failover support."""
@@ -36,7 +77,11 @@ class NetworkMixin:
     _host_failover: Dict[str, str]
     _host_ip_overrides: Dict[str, str]
     _host_alternatives: Dict[str, List[str]]
+    _dns_cache: Dict[str, Tuple[str, float]]
+    _tls_sessions: Dict[Tuple[str, str], ssl.SSLSession]
     _ssl_context: ssl.SSLContext
+    _http_pool: Dict[Tuple[str, str, Optional[int]], List[http.client.HTTPConnection]]
+    _http_pool_lock: threading.Lock
 
     def _fetch_html(self, url: str, *, attempts: int = 3) -> Optional[str]:
         """Download ``url`` and return the HTML body as text."""
@@ -44,6 +89,50 @@ class NetworkMixin:
         payload = self._fetch(url, attempts=attempts)
         if payload is None:
             return None
+        return self._decode_html(payload)
+
+    def _fetch_html_conditional(
+        self,
+        url: str,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        attempts: int = 3,
+    ) -> Optional[HTMLPage]:
+        """Download ``url`` unless it is unchanged since the given validators.
+
+        ``If-None-Match``/``If-Modified-Since`` are sent for the stored
+        validators; a ``304`` yields a page with ``not_modified`` set and no
+        HTML. Returns ``None`` when the download fails.
+        """
+
+        headers = {"User-Agent": USER_AGENT}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = self._fetch_response(url, attempts=attempts, headers=headers)
+        if response is None:
+            return None
+        status, payload, response_headers = response
+        if status == 304:
+            return HTMLPage(
+                None,
+                True,
+                response_headers.get("ETag") or etag,
+                response_headers.get("Last-Modified") or last_modified,
+            )
+        return HTMLPage(
+            self._decode_html(payload),
+            False,
+            response_headers.get("ETag"),
+            response_headers.get("Last-Modified"),
+        )
+
+    @staticmethod
+    def _decode_html(payload: bytes) -> str:
+        """Decode an HTML body, falling back to latin-1 for invalid UTF-8."""
+
         try:
             return payload.decode("utf-8")
         except UnicodeDecodeError:
@@ -52,26 +141,33 @@ class NetworkMixin:
     def _fetch(self, url: str, *, attempts: int = 3) -> Optional[bytes]:
         """Download raw bytes from ``url`` with retry and failover logic."""
 
+        response = self._fetch_response(
+            url, attempts=attempts, headers={"User-Agent": USER_AGENT}
+        )
+        if response is None:
+            return None
+        return response[1]
+
+    def _fetch_response(
+        self, url: str, *, attempts: int, headers: Dict[str, str]
+    ) -> Optional[Tuple[int, bytes, Message]]:
+        """Return ``(status, body, headers)`` for ``url`` with retry and failover."""
+
         current_url = url
         for attempt in range(1, attempts + 1):
             try:
                 request_url = self._apply_host_override(current_url)
-                req = request.Request(request_url, headers={"User-Agent": USER_AGENT})
-                with request.urlopen(req, timeout=self.timeout) as response:
-                    if response.status >= 400:
-                        raise error.HTTPError(
-                            request_url,
-                            response.status,
-                            f"HTTP error {response.status}",
-                            response.headers,
-                            None,
-                        )
-                    data = response.read()
+                status, data, final_url, response_headers = self._http_get(
+                    request_url, headers=headers
+                )
+                # Without a redirect the host is either unchanged or already the
+                # recorded failover, so only parse the URLs when one happened.
+                if final_url != request_url:
                     original_host = parse.urlsplit(current_url).hostname
-                    final_host = parse.urlsplit(response.geturl()).hostname
+                    final_host = parse.urlsplit(final_url).hostname
                     if original_host and final_host and original_host != final_host:
                         self._host_failover[original_host] = final_host
-                    return data
+                return status, data, response_headers
             except (error.URLError, error.HTTPError, socket.timeout) as exc:
                 delay = min(2 ** attempt, 10)
                 parts = parse.urlsplit(current_url)
@@ -101,7 +197,7 @@ class NetworkMixin:
                             data = self._fetch_via_direct_ip(parts, resolved_ip)
                             if data is not None:
                                 self._host_ip_overrides[canonical_host] = resolved_ip
-                                return data
+                                return 200, data, Message()
                 if attempt == attempts:
                     LOGGER.error("Failed to download %s: %s", current_url, exc)
                     return None
@@ -115,6 +211,134 @@ class NetworkMixin:
                 current_url = self._apply_host_override(url)
         return None
 
+    def _http_get(
+        self, url: str, *, headers: Dict[str, str]
+    ) -> Tuple[int, bytes, str, Message]:
+        """GET ``url`` over a pooled keep-alive connection, following redirects.
+
+        Returns the status, body, final URL and response headers. A ``304`` is
+        returned like a success; other failures are raised as
+        :mod:`urllib.error` exceptions so callers keep their existing handling.
+        Proxied or non-HTTP URLs are delegated to :func:`urllib.request.urlopen`.
+        """
+
+        current_url = url
+        proxies = request.getproxies()
+        for _ in range(_HTTP_MAX_REDIRECTS + 1):
+            parts = parse.urlsplit(current_url)
+            if (
+                parts.scheme not in {"http", "https"}
+                or not parts.hostname
+                or parts.scheme in proxies
+            ):
+                req = request.Request(current_url, headers=headers)
+                try:
+                    with request.urlopen(req, timeout=self.timeout) as response:
+                        return (
+                            response.status,
+                            response.read(),
+                            response.geturl(),
+                            response.headers,
+                        )
+                except error.HTTPError as exc:
+                    if exc.code != 304:
+                        raise
+                    return 304, b"", current_url, exc.headers
+            status, response_headers, data = self._pooled_request(parts, headers)
+            location = response_headers.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                current_url = parse.urljoin(current_url, location)
+                continue
+            # ``urlopen`` raises for every unfollowed 3xx as well, so a redirect
+            # without a usable Location goes through the retry path too.
+            if status >= 300 and status != 304:
+                raise error.HTTPError(
+                    current_url,
+                    status,
+                    f"HTTP error {status}",
+                    response_headers,
+                    None,
+                )
+            return status, data, current_url, response_headers
+        raise error.URLError(f"Too many redirects while fetching {url}")
+
+    def _pooled_request(
+        self, parts: parse.SplitResult, headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Issue a GET for ``parts`` on a reusable connection to its host."""
+
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        while True:
+            connection, reused = self._checkout_connection(key)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                # The server may have dropped an idle keep-alive connection;
+                # retry once on a fresh socket before reporting a failure.
+                if reused and isinstance(
+                    exc,
+                    (
+                        http.client.RemoteDisconnected,
+                        ConnectionResetError,
+                        BrokenPipeError,
+                    ),
+                ):
+                    continue
+                raise error.URLError(exc) from exc
+            if response.will_close:
+                connection.close()
+            else:
+                self._release_connection(key, connection)
+            return response.status, response.headers, data
+
+    def _checkout_connection(
+        self, key: Tuple[str, str, Optional[int]]
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle pooled connection for ``key`` or open a new one."""
+
+        with self._http_pool_lock:
+            idle = self._http_pool.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        if scheme == "https":
+            return (
+                http.client.HTTPSConnection(
+                    host, port, timeout=self.timeout, context=self._ssl_context
+                ),
+                False,
+            )
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _release_connection(
+        self,
+        key: Tuple[str, str, Optional[int]],
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        """Return ``connection`` to the pool, closing it when the pool is full."""
+
+        with self._http_pool_lock:
+            idle = self._http_pool.setdefault(key, [])
+            if len(idle) < _HTTP_POOL_MAXSIZE:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _close_http_pool(self) -> None:
+        """Close every idle keep-alive connection."""
+
+        with self._http_pool_lock:
+            connections = [conn for idle in self._http_pool.values() for conn in idle]
+            self._http_pool.clear()
+        for connection in connections:
+            connection.close()
+
     def _fetch_via_direct_ip(
         self, parts: parse.SplitResult, ip_address: str
     ) -> Optional[bytes]:
@@ -128,18 +352,12 @@ class NetworkMixin:
         path = parts.path or "/"
         if parts.query:
             path = f"{path}?{parts.query}"
-        connection = _DirectHTTPSConnection(
-            ip_address,
-            server_hostname=hostname,
-            timeout=self.timeout,
-            context=self._ssl_context,
-        )
+        connection = self._open_direct_connection(ip_address, hostname)
         try:
             headers = {
                 "Host": hostname,
                 "User-Agent": USER_AGENT,
                 "Accept": "*/*",
-                "Connection": "close",
             }
             connection.request("GET", path, headers=headers)
             response = connection.getresponse()
@@ -159,12 +377,40 @@ class NetworkMixin:
                 exc_info=True,
             )
         finally:
-            connection.close()
+            self._close_direct_connection(connection)
         return None
 
+    def _open_direct_connection(
+        self, ip_address: str, hostname: str
+    ) -> "_DirectHTTPSConnection":
+        """Create a direct-IP connection that resumes a cached TLS session."""
+
+        return _DirectHTTPSConnection(
+            ip_address,
+            server_hostname=hostname,
+            timeout=self.timeout,
+            context=self._ssl_context,
+            session=self._tls_sessions.get((ip_address, hostname)),
+        )
+
+    def _close_direct_connection(self, connection: "_DirectHTTPSConnection") -> None:
+        """Remember the TLS session of ``connection`` and close it.
+
+        Direct requests do not send ``Connection: close``, so the socket and its
+        session ticket are still available here.
+        """
+
+        sock = connection.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            key = (connection.host, connection.server_hostname)
+            self._tls_sessions[key] = sock.session
+        connection.close()
+
     def _apply_host_override(self, url: str) -> str:
         """Rewrite ``url`` to use a previously successful fallback host."""
 
+        if not self._host_failover:
+            return url
         parts = parse.urlsplit(url)
         host = parts.hostname
         if not host:
@@ -178,6 +424,12 @@ class NetworkMixin:
     def _resolve_host_via_doh(self, hostname: str) -> Optional[str]:
         """Resolve ``hostname`` via DNS-over-HTTPS, returning an IPv4 string."""
 
+        cached = self._dns_cache.get(hostname)
+        if cached is not None:
+            ip_address, expires_at = cached
+            if time.monotonic() < expires_at:
+                return ip_address
+            del self._dns_cache[hostname]
         resolver_endpoint = os.environ.get(
             "INCISCRAPER_DOH_ENDPOINT", "https://dns.google/resolve"
         )
@@ -194,26 +446,29 @@ class NetworkMixin:
         answers = payload.get("Answer")
         if not answers:
             return None
+        # The whole answer chain (CNAMEs included) expires with its shortest TTL.
+        ttls = [
+            answer["TTL"] for answer in answers if isinstance(answer.get("TTL"), int)
+        ]
+        ttl = min(ttls) if ttls else _DOH_CACHE_TTL
         for answer in answers:
             if answer.get("type") == 1:
                 ip_address = answer.get("data")
                 if ip_address:
+                    self._dns_cache[hostname] = (ip_address, time.monotonic() + ttl)
                     return ip_address
         return None
 
     def _download_doh_payload(self, doh_url: str) -> Optional[Dict[str, object]]:
         """Fetch a DNS-over-HTTPS JSON response."""
 
-        req = request.Request(
-            doh_url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Accept": "application/dns-json",
-            },
-        )
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "application/dns-json",
+        }
         try:
-            with request.urlopen(req, timeout=self.timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
+            _, data, _, _ = self._http_get(doh_url, headers=headers)
+            return _load_json(data)
         except error.URLError as exc:
             root_cause = getattr(exc, "reason", None)
             if isinstance(root_cause, socket.gaierror):
@@ -240,23 +495,17 @@ class NetworkMixin:
         path = parsed.path or "/"
         if parsed.query:
             path = f"{path}?{parsed.query}"
-        connection = _DirectHTTPSConnection(
-            ip_address,
-            server_hostname=hostname,
-            timeout=self.timeout,
-            context=self._ssl_context,
-        )
+        connection = self._open_direct_connection(ip_address, hostname)
         try:
             headers = {
                 "Host": hostname,
                 "User-Agent": USER_AGENT,
                 "Accept": "application/dns-json",
-                "Connection": "close",
             }
             connection.request("GET", path, headers=headers)
             response = connection.getresponse()
             if 200 <= response.status < 300:
-                return json.loads(response.read().decode("utf-8"))
+                return _load_json(response.read())
             LOGGER.debug(
                 "Direct IP DoH request to %s for %s returned HTTP %s",
                 ip_address,
@@ -271,7 +520,7 @@ class NetworkMixin:
                 exc_info=True,
             )
         finally:
-            connection.close()
+            self._close_direct_connection(connection)
         return None
 
     @staticmethod
@@ -289,11 +538,12 @@ class NetworkMixin:
     ) -> Dict[str, List[str]]:
         """Compute fallback hostnames that can serve INCIDecoder content."""
 
-        hosts: List[str] = []
+        # A dict keeps insertion order and gives O(1) de-duplication.
+        hosts: Dict[str, None] = {}
 
         def _ensure_host(value: Optional[str]) -> None:
-            if value and value not in hosts:
-                hosts.append(value)
+            if value:
+                hosts.setdefault(value)
 
         base_host = parse.urlsplit(base_url).hostname
         _ensure_host(base_host)
@@ -305,11 +555,10 @@ class NetworkMixin:
                 _ensure_host(existing[4:])
             else:
                 _ensure_host(f"www.{existing}")
-        alternatives: Dict[str, List[str]] = {}
-        for host in hosts:
-            others = [candidate for candidate in hosts if candidate != host]
-            alternatives[host] = others
-        return alternatives
+        return {
+            host: [candidate for candidate in hosts if candidate != host]
+            for host in hosts
+        }
 
     def _replace_host(
         self, parts: parse.SplitResult, new_host: str
@@ -332,7 +581,7 @@ class NetworkMixin:
         self,
         image_url: Optional[str],
         product_name: str,
-        product_id: str,
+        product_id: int,
     ) -> Optional[str]:
         """Download and optionally compress the product lead image."""
 
@@ -343,17 +592,38 @@ class NetworkMixin:
             return None
         suffix = self._guess_extension(image_url)
         data, suffix = self._compress_image(data, suffix)
-        product_dir = self.image_dir / product_id
+        product_dir = self.image_dir / str(product_id)
         product_dir.mkdir(parents=True, exist_ok=True)
         filename = f"{product_id}_cover{suffix}"
         path = product_dir / filename
-        path.write_bytes(data)
+        with open(path, "wb") as handle:
+            handle.write(data)
+            if hasattr(os, "posix_fadvise"):
+                # The scraper never reads images back, so let the kernel drop
+                # them from the page cache once written instead of crowding
+                # out the SQLite database and WAL. Dirty pages are kept
+                # regardless of the hint, so the data is synced first.
+                try:
+                    handle.flush()
+                    os.fdatasync(handle.fileno())
+                    os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError as exc:
+                    LOGGER.debug("Could not release page cache for %s: %s", path, exc)
         return str(path)
 
     def _compress_image(self, data: bytes, original_suffix: str) -> Tuple[bytes, str]:
         """Compress ``data`` when Pillow is available."""
 
         global _PILLOW_WARNING_EMITTED
+        # Small WebP files are already compact; re-encoding them only burns CPU.
+        if (
+            len(data) < _WEBP_PASSTHROUGH_BYTES
+            and data[:4] == b"RIFF"
+            and data[8:12] == b"WEBP"
+        ):
+            return data, ".webp"
+        if len(data) < _JPEG_PASSTHROUGH_BYTES and data[:3] == b"\xff\xd8\xff":
+            return data, ".jpg"
         if Image is None or ImageFile is None:
             if not _PILLOW_WARNING_EMITTED:
                 LOGGER.warning(
@@ -368,7 +638,7 @@ class NetworkMixin:
                 image.load()
                 if image.format == "WEBP":
                     buffer = BytesIO()
-                    image.save(buffer, format="WEBP", lossless=True, method=6)
+                    image.save(buffer, format="WEBP", lossless=True, method=_WEBP_METHOD)
                     return buffer.getvalue(), ".webp"
                 if image.format in {"JPEG", "JPG"}:
                     buffer = BytesIO()
@@ -376,7 +646,7 @@ class NetworkMixin:
                     return buffer.getvalue(), ".jpg"
                 buffer = BytesIO()
                 try:
-                    save_kwargs = {"format": "WEBP", "lossless": True, "method": 6}
+                    save_kwargs = {"format": "WEBP", "lossless": True, "method": _WEBP_METHOD}
                     if image.mode not in {"RGB", "RGBA", "L", "LA"}:
                         image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
                     image.save(buffer, **save_kwargs)
@@ -398,23 +668,15 @@ class NetworkMixin:
     def _extension_to_format(suffix: str) -> str:
         """Translate a filename suffix to a Pillow image format string."""
 
-        suffix = suffix.lower().lstrip(".")
-        if suffix in {"jpg", "jpeg"}:
-            return "JPEG"
-        if suffix == "png":
-            return "PNG"
-        if suffix == "gif":
-            return "GIF"
-        if suffix == "webp":
-            return "WEBP"
-        return "PNG"
+        return _EXTENSION_FORMATS.get(suffix.lower().lstrip("."), "PNG")
 
     @staticmethod
     def _guess_extension(url: str) -> str:
         """Infer the most likely file extension from ``url``."""
 
-        parsed = parse.urlparse(url)
-        _, ext = os.path.splitext(parsed.path)
+        # ``urlsplit`` keeps ``;params`` in the path, so drop them from the suffix.
+        _, ext = os.path.splitext(parse.urlsplit(url).path)
+        ext = ext.partition(";")[0]
         return ext if ext else ".jpg"
 
 
@@ -428,9 +690,17 @@ class _DirectHTTPSConnection(http.client.HTTPSConnection):
         server_hostname: str,
         timeout: Optional[float],
         context: ssl.SSLContext,
+        session: Optional[ssl.SSLSession] = None,
     ) -> None:
         super().__init__(host, timeout=timeout, context=context)
         self._server_hostname = server_hostname
+        self._session = session
+
+    @property
+    def server_hostname(self) -> str:
+        """Return the hostname sent via SNI and used for certificate checks."""
+
+        return self._server_hostname
 
     def connect(self) -> None:  # pragma: no cover - exercised via network operations
         conn = socket.create_connection(
@@ -441,7 +711,11 @@ class _DirectHTTPSConnection(http.client.HTTPSConnection):
                 self.sock = conn
                 self._tunnel()
                 conn = self.sock  # type: ignore[assignment]
-            self.sock = self.context.wrap_socket(conn, server_hostname=self._server_hostname)
+            # Offering the previous session lets the server skip the full
+            # handshake when it still holds the ticket.
+            self.sock = self._context.wrap_socket(
+                conn, server_hostname=self._server_hostname, session=self._session
+            )
         except Exception:
             conn.close()
             raise
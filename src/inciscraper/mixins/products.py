@@ -5,18 +5,23 @@ from __future__ import annotations
 import logging
 import sqlite3
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from ..constants import PROGRESS_LOG_INTERVAL
 from ..parser import extract_text, parse_html
 
 LOGGER = logging.getLogger(__name__)
 
+# Listing markups seen so far, in the order their anchors are collected.
+_PRODUCT_ANCHOR_CLASSES = ("productlist__item", "product-card", "product__item")
+
 
 class ProductScraperMixin:
     """Mixin implementing product list scraping."""
 
     conn: sqlite3.Connection
+    _page_fetch_pool: ThreadPoolExecutor
 
     def scrape_products(
         self,
@@ -31,11 +36,12 @@ class ProductScraperMixin:
         self._retry_incomplete_brand_products()
         if rescan_all:
             cursor = self.conn.execute(
-                "SELECT id, name, url FROM brands ORDER BY id",
+                "SELECT id, name, url, products_scraped FROM brands ORDER BY id",
             )
         else:
             cursor = self.conn.execute(
-                "SELECT id, name, url FROM brands WHERE products_scraped = 0 ORDER BY id",
+                "SELECT id, name, url, products_scraped FROM brands "
+                "WHERE products_scraped = 0 ORDER BY id",
             )
         pending_brands = cursor.fetchall()
         if max_brands is not None:
@@ -49,8 +55,12 @@ class ProductScraperMixin:
         else:
             LOGGER.debug("Product workload: %s brand(s) awaiting scraping", total_brands)
         processed = 0
-        # Get total brands for progress tracking
+        # Get total brands for progress tracking; the completed count is then
+        # maintained in Python as brands finish.
         total_brands_count = self.conn.execute("SELECT COUNT(*) FROM brands").fetchone()[0]
+        brands_with_products = self.conn.execute(
+            "SELECT COUNT(*) FROM brands WHERE products_scraped = 1"
+        ).fetchone()[0]
         
         for brand in pending_brands:
             # Check if user requested pause/stop
@@ -79,37 +89,40 @@ class ProductScraperMixin:
                 start_offset=start_offset,
                 max_products=max_products_per_brand,
             )
-            self.conn.commit()
+            # The brand's products, completion flag and progress metadata are
+            # committed together once the brand is done.
             if completed:
                 self.conn.execute(
                     "UPDATE brands SET products_scraped = 1 WHERE id = ?",
                     (brand_id,),
                 )
-                self.conn.commit()
-                self._delete_metadata(resume_key)
-                
-                # Update progress metadata AFTER brand is successfully completed
-                brands_with_products = self.conn.execute(
-                    "SELECT COUNT(*) FROM brands WHERE products_scraped = 1"
-                ).fetchone()[0]
-                self._set_metadata("progress_products_current_brand", str(brands_with_products))
-                self._set_metadata("progress_products_total_brands", str(total_brands_count))
+                self._delete_metadata(resume_key, commit=False)
+                if not brand["products_scraped"]:
+                    brands_with_products += 1
+                self._set_metadata_many(
+                    (
+                        ("progress_products_current_brand", str(brands_with_products)),
+                        ("progress_products_total_brands", str(total_brands_count)),
+                    ),
+                    commit=False,
+                )
                 product_total = self._count_products_for_brand(brand_id)
                 if product_total == 0:
                     LOGGER.warning(
                         "Brand %s marked complete but no products recorded – flagging for review",
                         brand["name"],
                     )
-                    self._set_metadata(f"brand_empty_products:{brand_id}", "1")
+                    self._set_metadata(f"brand_empty_products:{brand_id}", "1", commit=False)
                 else:
-                    self._delete_metadata(f"brand_empty_products:{brand_id}")
+                    self._delete_metadata(f"brand_empty_products:{brand_id}", commit=False)
             else:
-                self._set_metadata(resume_key, str(next_offset))
+                self._set_metadata(resume_key, str(next_offset), commit=False)
                 LOGGER.debug(
                     "Product collection for brand %s interrupted – will retry from offset %s",
                     brand["name"],
                     next_offset,
                 )
+            self.conn.commit()
             status = "complete" if completed else "incomplete"
             LOGGER.debug(
                 "Finished brand %s – %s products recorded (%s)",
@@ -123,7 +136,7 @@ class ProductScraperMixin:
 
     def _collect_products_for_brand(
         self,
-        brand_id: str,
+        brand_id: int,
         brand_url: str,
         *,
         start_offset: int = 1,
@@ -144,11 +157,18 @@ class ProductScraperMixin:
                 )
                 return 0, True, offset
         fallback_attempted = False
+        # The next listing page is requested (after the usual pause) on a
+        # worker thread while the current one is written to SQLite.
+        next_page: Optional[Future] = None
         while True:
             page_url = self._append_offset(brand_url, offset)
             current_url = page_url
             LOGGER.debug("Fetching product listing page %s", current_url)
-            html = self._fetch_html(current_url)
+            if next_page is not None:
+                html = next_page.result()
+                next_page = None
+            else:
+                html = self._fetch_html(current_url)
             if (
                 html is None
                 and offset == start_offset == 1
@@ -186,44 +206,53 @@ class ProductScraperMixin:
             if not products:
                 LOGGER.debug("No more products found on %s", page_url)
                 return total, True, offset
-            for name, url in products:
-                inserted = self._insert_product(brand_id, name, url)
-                if inserted:
-                    total += 1
-                if (
-                    max_products is not None
-                    and existing_total + total >= max_products
-                ):
+            new_count = None
+            if max_products is not None:
+                products, new_count = self._take_until_new_limit(
+                    "products", products, max_products - existing_total - total
+                )
+                if existing_total + total + new_count >= max_products:
+                    self._insert_products_bulk(brand_id, products)
+                    total += new_count
                     LOGGER.debug(
                         "Reached product limit (%s) for brand %s",
                         max_products,
                         brand_url,
                     )
                     return total, True, offset
+            next_page = self._page_fetch_pool.submit(
+                self._fetch_html_after_pause,
+                self._append_offset(brand_url, offset + 1),
+            )
+            inserted = self._insert_products_bulk(brand_id, products)
+            total += inserted if new_count is None else new_count
             offset += 1
-            self._adaptive_sleep()
+
+    def _fetch_html_after_pause(self, url: str) -> Optional[str]:
+        """Wait the adaptive politeness delay, then download ``url``."""
+
+        self._adaptive_sleep()
+        return self._fetch_html(url)
 
     def _retry_incomplete_brand_products(self) -> None:
         """Requeue brands that were marked complete without stored products."""
 
+        # Both anti-joins are index probes per completed brand
+        # (idx_products_brand and the metadata key).
         cursor = self.conn.execute(
             """
             SELECT b.id, b.name
             FROM brands b
-            LEFT JOIN (
-                SELECT brand_id, COUNT(*) AS product_count
-                FROM products
-                GROUP BY brand_id
-            ) p ON p.brand_id = b.id
             WHERE b.products_scraped = 1
-              AND IFNULL(p.product_count, 0) = 0
+              AND NOT EXISTS (SELECT 1 FROM products p WHERE p.brand_id = b.id)
+              AND NOT EXISTS (
+                  SELECT 1 FROM metadata m
+                  WHERE m.key = 'brand_empty_products:' || b.id AND m.value = '1'
+              )
             ORDER BY b.id
             """
         )
         for row in cursor.fetchall():
-            marker_key = f"brand_empty_products:{row['id']}"
-            if self._get_metadata(marker_key) == "1":
-                continue
             LOGGER.info(
                 "Brand %s previously marked complete but has no products – scheduling retry",
                 row["name"],
@@ -234,7 +263,7 @@ class ProductScraperMixin:
             )
         self.conn.commit()
 
-    def _count_products_for_brand(self, brand_id: str) -> int:
+    def _count_products_for_brand(self, brand_id: int) -> int:
         """Return how many products have been stored for the brand."""
 
         cursor = self.conn.execute(
@@ -246,71 +275,76 @@ class ProductScraperMixin:
     def _parse_product_list(self, html: str) -> List[Tuple[str, str]]:
         """Extract product names and URLs from a listing page."""
 
-        root = parse_html(html)
+        # One walk collects every anchor; the class and href filters below
+        # then run over that list instead of re-walking the tree.
+        all_anchors = parse_html(html).find_all(tag="a")
         anchors = []
-        for class_name in ("productlist__item", "product-card", "product__item"):
-            anchors.extend(root.find_all(tag="a", class_=class_name))
+        for class_name in _PRODUCT_ANCHOR_CLASSES:
+            anchors.extend(node for node in all_anchors if node.has_class(class_name))
         if not anchors:
             anchors = [
                 node
-                for node in root.find_all(tag="a")
+                for node in all_anchors
                 if node.get("href", "").startswith("/products/")
             ]
         seen = set()
+        seen_hrefs = set()
         products: List[Tuple[str, str]] = []
         for anchor in anchors:
             href = anchor.get("href")
+            # Repeated anchors (image and title links of one card) are dropped
+            # on the raw href before paying for their text extraction.
+            if not href or href in seen_hrefs:
+                continue
             name = extract_text(anchor)
-            if not href or not name:
+            if not name:
                 continue
             absolute = self._absolute_url(href)
             if absolute in seen:
                 continue
             seen.add(absolute)
+            seen_hrefs.add(href)
             products.append((name, absolute))
         return products
 
-    def _insert_product(self, brand_id: str, name: str, url: str) -> bool:
-        """Persist a product, updating its name if it already exists."""
+    def _insert_products_bulk(
+        self, brand_id: int, products: List[Tuple[str, str]]
+    ) -> int:
+        """Insert or update a page of products and return how many were new.
 
-        now = self._current_timestamp()
-        row = self.conn.execute(
-            "SELECT id, brand_id, name, last_updated_at FROM products WHERE url = ?",
-            (url,),
-        ).fetchone()
-        if row is None:
-            while True:
-                product_id = self._generate_id()
-                try:
-                    self.conn.execute(
-                        """
-                        INSERT INTO products (
-                            id, brand_id, name, url, details_scraped, last_checked_at, last_updated_at
-                        ) VALUES (?, ?, ?, ?, 0, ?, ?)
-                        """,
-                        (product_id, brand_id, name, url, now, now),
-                    )
-                except sqlite3.IntegrityError as exc:
-                    if "products.id" in str(exc):
-                        continue
-                    raise
-                return True
-        updates: Dict[str, object] = {"last_checked_at": now}
-        changed = False
-        if row["name"] != name:
-            updates["name"] = name
-            changed = True
-        if row["brand_id"] != brand_id:
-            updates["brand_id"] = brand_id
-            changed = True
-        if changed or not row["last_updated_at"]:
-            updates["last_updated_at"] = now
-        if updates:
-            assignments = ", ".join(f"{column} = ?" for column in updates)
-            params = list(updates.values()) + [row["id"]]
-            self.conn.execute(
-                f"UPDATE products SET {assignments} WHERE id = ?",
-                params,
-            )
-        return False
+        New products are inserted and existing ones refresh ``brand_id``,
+        ``name`` and ``last_checked_at``; ``last_updated_at`` moves only when
+        the name or brand changed or was never stamped.  The surrounding brand
+        loop commits the page.
+        """
 
+        if not products:
+            return 0
+        urls = {url for _, url in products}
+        placeholders = ", ".join("?" for _ in urls)
+        known = self.conn.execute(
+            f"SELECT COUNT(*) FROM products WHERE url IN ({placeholders})",
+            tuple(urls),
+        ).fetchone()[0]
+        now = self._current_timestamp()
+        self.conn.executemany(
+            """
+            INSERT INTO products (
+                brand_id, name, url, details_scraped, last_checked_at, last_updated_at
+            ) VALUES (?, ?, ?, 0, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                brand_id = excluded.brand_id,
+                name = excluded.name,
+                last_checked_at = excluded.last_checked_at,
+                last_updated_at = CASE
+                    WHEN products.name != excluded.name
+                         OR products.brand_id != excluded.brand_id
+                         OR products.last_updated_at IS NULL
+                         OR products.last_updated_at = ''
+                    THEN excluded.last_updated_at
+                    ELSE products.last_updated_at
+                END
+            """,
+            [(brand_id, name, url, now, now) for name, url in products],
+        )
+        return len(urls) - known
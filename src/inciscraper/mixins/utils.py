@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
 from urllib.parse import urlsplit
 
+from ..parser import Node, parse_html
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_PARSE_CACHE_SIZE = 4
+
 
 class UtilityMixin:
     """Provide generic helper methods for URL and string handling."""
 
     base_url: str
+    _parse_cache: "OrderedDict[str, Node]"
+
+    def _parse_html_cached(self, html: str) -> Node:
+        """Parse ``html``, reusing the tree if the same page was parsed recently.
+
+        CosIng pages are parsed once to recognise the detail view and again to
+        read its table, so a few recent trees are enough to avoid the rework.
+        """
+
+        root = self._parse_cache.get(html)
+        if root is not None:
+            self._parse_cache.move_to_end(html)
+            return root
+        root = parse_html(html)
+        self._parse_cache[html] = root
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return root
 
     def _current_timestamp(self) -> str:
         """Return the current UTC timestamp in ISO 8601 format."""
@@ -43,12 +67,18 @@ class UtilityMixin:
         """Generate a filesystem-friendly slug from ``value``."""
 
         value = value.lower()
-        value = re.sub(r"[^a-z0-9]+", "-", value)
+        value = _SLUG_RE.sub("-", value)
         value = value.strip("-")
         return value or "product"
 
     def _normalize_whitespace(self, value: str) -> str:
         """Collapse consecutive whitespace characters to single spaces."""
 
-        return re.sub(r"\s+", " ", value).strip()
+        value = value.strip()
+        # ``isprintable`` is False for every whitespace character except the
+        # plain space, so already clean values are returned as they are.
+        if "  " not in value and value.isprintable():
+            return value
+        # ``str.split()`` splits on exactly the characters ``\s`` matches.
+        return " ".join(value.split())
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class IngredientReference:
     """Reference to an ingredient mentioned within a product listing."""
 
@@ -14,10 +14,10 @@ class IngredientReference:
     url: str
     tooltip_text: Optional[str]
     tooltip_ingredient_link: Optional[str]
-    ingredient_id: Optional[str] = None
+    ingredient_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngredientFunction:
     """Function metadata extracted for an ingredient."""
 
@@ -27,7 +27,7 @@ class IngredientFunction:
     function_links: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CosIngRecord:
     """Structured data retrieved from the CosIng public database."""
 
@@ -38,7 +38,7 @@ class CosIngRecord:
     functions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HighlightEntry:
     """Represents a highlighted ingredient and optional function link."""
 
@@ -48,7 +48,7 @@ class HighlightEntry:
     ingredient_page: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class FreeTag:
     """A hashtag style marketing claim with an optional tooltip."""
 
@@ -56,7 +56,7 @@ class FreeTag:
     tooltip: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductHighlights:
     """Container for hashtag and ingredient highlight sections."""
 
@@ -65,7 +65,7 @@ class ProductHighlights:
     other_ingredients: List[HighlightEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductDetails:
     """Structured representation of all parsed product details."""
 
@@ -79,7 +79,7 @@ class ProductDetails:
     replacement_product_url: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class IngredientDetails:
     """Normalized information fetched from an ingredient page."""
 
@@ -99,7 +99,7 @@ class IngredientDetails:
     proof_references: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class IngredientFunctionInfo:
     """Describes a single cosmetic function entry."""
 
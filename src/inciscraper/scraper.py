@@ -6,16 +6,18 @@ import asyncio
 import json
 import logging
 import os
-import secrets
 import sqlite3
 import ssl
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Optional
 
-from .constants import BASE_URL, DEFAULT_TIMEOUT
+from .constants import BASE_URL, DEFAULT_TIMEOUT, DETAIL_PREFETCH_WINDOW
 from .lru_cache import LRUCache
+from .parser import Node
 from .mixins import (
     AsyncNetworkMixin,
     BatchProcessorMixin,
@@ -65,16 +67,22 @@ class INCIScraper(
         self.conn.row_factory = sqlite3.Row
         self._host_failover: dict[str, str] = {}
         self._host_ip_overrides: dict[str, str] = {}
+        self._dns_cache: dict[str, tuple[str, float]] = {}
+        self._tls_sessions: dict[tuple[str, str], ssl.SSLSession] = {}
         self._host_alternatives = self._build_host_alternatives(
             self.base_url, alternate_base_urls or []
         )
         self._ssl_context = ssl.create_default_context()
+        self._http_pool = {}
+        self._http_pool_lock = threading.Lock()
         self._cosing_playwright = None
         self._cosing_browser = None
         self._cosing_context = None
         self._cosing_page = None
         self._cosing_playwright_failed = False
         self._cosing_record_cache = LRUCache(max_size=10000)  # LRU cache for CosIng records
+        self._function_id_cache: dict[str, tuple[int, str]] = {}
+        self._parse_cache: OrderedDict[str, Node] = OrderedDict()
         
         # Adaptive sleep tracking
         self._request_success_count = 0
@@ -95,6 +103,11 @@ class INCIScraper(
         # Initialize thread pool for image processing
         self._image_thread_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image_processing")
         
+        # Initialize thread pool for prefetching product pages
+        self._page_fetch_pool = ThreadPoolExecutor(
+            max_workers=DETAIL_PREFETCH_WINDOW, thread_name_prefix="page_fetch"
+        )
+        
         self._init_db()
 
     # ------------------------------------------------------------------
@@ -148,6 +161,7 @@ class INCIScraper(
             """
         )
         self.conn.commit()
+        self._function_id_cache.clear()
         
         if products_per_brand is None:
             LOGGER.info(
@@ -218,6 +232,10 @@ class INCIScraper(
         # Shutdown thread pool
         if hasattr(self, '_image_thread_pool'):
             self._image_thread_pool.shutdown(wait=True)
+        if hasattr(self, '_page_fetch_pool'):
+            self._page_fetch_pool.shutdown(wait=True, cancel_futures=True)
+        
+        self._close_http_pool()
         
         # Close async session
         if hasattr(self, '_close_async_session'):
@@ -231,17 +249,13 @@ class INCIScraper(
                 loop.run_until_complete(self._close_async_session())
                 loop.close()
         
+        # Refresh planner statistics for the indexes when they have drifted.
+        self.conn.execute("PRAGMA optimize")
         self.conn.close()
 
     # ------------------------------------------------------------------
     # Helper utilities
     # ------------------------------------------------------------------
-    @staticmethod
-    def _generate_id() -> str:
-        """Return a random identifier suitable for primary keys."""
-
-        return secrets.token_hex(16)
-    
     def _adaptive_sleep(self) -> None:
         """Sleep with adaptive timing based on request success/error rates."""
         time.sleep(self._current_sleep_time)
@@ -278,7 +292,7 @@ class INCIScraper(
             'max_sleep_time': self._max_sleep_time,
         }
     
-    def _download_image_parallel(self, image_url: str, product_name: str, product_id: str) -> Optional[str]:
+    def _download_image_parallel(self, image_url: str, product_name: str, product_id: int) -> Optional[str]:
         """Download image in a separate thread."""
         if not hasattr(self, '_image_thread_pool'):
             # Fallback to synchronous download